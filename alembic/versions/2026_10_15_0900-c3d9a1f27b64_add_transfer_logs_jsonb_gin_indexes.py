@@ -0,0 +1,53 @@
+"""add_transfer_logs_jsonb_gin_indexes
+
+Revision ID: c3d9a1f27b64
+Revises: 411af4492c4a
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9a1f27b64'
+down_revision: Union[str, None] = '411af4492c4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# jsonb_path_ops only supports containment (@>, @?, @@) but is about half the
+# size of the default jsonb_ops, which is all the audit/parameter lookups need.
+GIN_INDEXES = {
+    'ix_transfer_logs_audit_log_gin': 'audit_log',
+    'ix_transfer_logs_parameters_gin': 'parameters',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY avoids locking transfer_logs for writes on large tables,
+    # but cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for index_name, column in GIN_INDEXES.items():
+            op.create_index(
+                index_name,
+                'transfer_logs',
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name in GIN_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name='transfer_logs',
+                postgresql_concurrently=True,
+            )
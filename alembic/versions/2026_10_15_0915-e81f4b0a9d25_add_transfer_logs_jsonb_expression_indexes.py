@@ -0,0 +1,47 @@
+"""add_transfer_logs_jsonb_expression_indexes
+
+Revision ID: e81f4b0a9d25
+Revises: c3d9a1f27b64
+Create Date: 2026-10-15 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81f4b0a9d25'
+down_revision: Union[str, None] = 'c3d9a1f27b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The GIN indexes from c3d9a1f27b64 only serve @>/?/@? operators. Filters on a
+# single scalar key need a BTREE on the exact expression, so queries must use
+# the text operator with the same spelling, e.g.
+#   WHERE parameters->>'priority' = 'high'
+# Comparing against another type needs the cast inside the expression as well,
+# otherwise the planner will not match it to these indexes.
+EXPRESSION_INDEXES = {
+    'ix_transfer_logs_params_priority': "(parameters->>'priority')",
+    'ix_transfer_logs_audit_actor': "(audit_log->>'actor')",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, expression in EXPRESSION_INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON transfer_logs ({expression})"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name in EXPRESSION_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
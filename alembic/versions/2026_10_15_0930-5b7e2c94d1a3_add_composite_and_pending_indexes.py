@@ -0,0 +1,55 @@
+"""add_composite_and_pending_indexes
+
+Revision ID: 5b7e2c94d1a3
+Revises: e81f4b0a9d25
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2c94d1a3'
+down_revision: Union[str, None] = 'e81f4b0a9d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns, partial predicate)
+INDEXES = [
+    ('ix_import_jobs_source_status', 'import_jobs', ['source_org_id', 'status'], None),
+    ('ix_import_jobs_dest_created', 'import_jobs', ['destination_org_id', 'created_at'], None),
+    ('ix_import_jobs_pending_created', 'import_jobs', ['created_at'], "status = 'PENDING'"),
+    ('ix_transfers_record_status', 'transfer_logs', ['record_id', 'status'], None),
+    ('ix_transfers_dest_created', 'transfer_logs', ['destination_org_id', 'created_at'], None),
+    ('ix_transfers_pending_created', 'transfer_logs', ['created_at'], "status = 'PENDING'"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table, columns, where in INDEXES:
+            op.create_index(
+                index_name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table, _, _ in INDEXES:
+            op.drop_index(
+                index_name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,45 @@
+"""import_jobs_parameters_to_jsonb
+
+Revision ID: 9d3f61a0c7b2
+Revises: 5b7e2c94d1a3
+Create Date: 2026-10-15 09:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f61a0c7b2'
+down_revision: Union[str, None] = '5b7e2c94d1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # transfer_logs already uses JSONB since 411af4492c4a; only import_jobs was
+    # created with plain json. The USING cast rewrites the column in place.
+    op.alter_column(
+        'import_jobs',
+        'parameters',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='parameters::jsonb',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'import_jobs',
+        'parameters',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='parameters::json',
+    )
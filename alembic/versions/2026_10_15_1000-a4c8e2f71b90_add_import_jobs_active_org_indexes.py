@@ -0,0 +1,54 @@
+"""add_import_jobs_active_org_indexes
+
+Revision ID: a4c8e2f71b90
+Revises: 9d3f61a0c7b2
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f71b90'
+down_revision: Union[str, None] = '9d3f61a0c7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# One partial index per side of the "source OR destination" filter in
+# get_active_imports_count, so the planner can BitmapOr them. The predicate
+# must match the query's status IN list (enum names, as stored).
+ACTIVE_PREDICATE = "status IN ('PENDING', 'PROCESSING')"
+INDEXES = {
+    'ix_import_jobs_source_active': 'source_org_id',
+    'ix_import_jobs_dest_active': 'destination_org_id',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, column in INDEXES.items():
+            op.create_index(
+                index_name,
+                'import_jobs',
+                [column],
+                postgresql_where=sa.text(ACTIVE_PREDICATE),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name in INDEXES:
+            op.drop_index(
+                index_name,
+                table_name='import_jobs',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,34 @@
+"""add_medical_records_is_active
+
+Revision ID: b7d1e5c3f842
+Revises: a4c8e2f71b90
+Create Date: 2026-10-15 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d1e5c3f842'
+down_revision: Union[str, None] = 'a4c8e2f71b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# medical_records is not created by these migrations, hence IF EXISTS. A
+# constant DEFAULT makes ADD COLUMN a catalog-only change (PostgreSQL 11+),
+# so existing rows are not rewritten.
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "ALTER TABLE IF EXISTS medical_records "
+        "ADD COLUMN IF NOT EXISTS is_active boolean NOT NULL DEFAULT true"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE IF EXISTS medical_records DROP COLUMN IF EXISTS is_active")
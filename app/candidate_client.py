@@ -1,6 +1,7 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hmac
-import hashlib
 import time
 import logging
 from config import AppConfig
@@ -8,25 +9,34 @@ from config import AppConfig
 class CandidateClient:
     def __init__(self):
         self.config = AppConfig()
+        self._secret_bytes = self.config.request_secret.encode()
         self.session = requests.Session()
         self._setup_session()
 
     def _setup_session(self):
-        """Configure commons headers"""
+        """Configure commons headers and the pooled transport"""
         self.session.headers.update({
             "User-Agent": "LTS-Python-Client/1.0",
             "Accept": "application/json",
-            "X-API-Source": "python-microservice"
+            "X-API-Source": "python-microservice",
+            "Connection": "keep-alive"
         })
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def _generate_auth_headers(self, body: str) -> dict:
         """Generate authentication headers using environment variables"""
         timestamp = str(int(time.time()))
-        signature = hmac.new(
-            key=self.config.request_secret.encode(),
-            msg=f"{timestamp}{body}".encode(),
-            digestmod=hashlib.sha256
-        ).hexdigest()
+        signature = hmac.digest(
+            self._secret_bytes,
+            f"{timestamp}{body}".encode(),
+            'sha256'
+        ).hex()
         
         return {
             "X-API-Signature": signature,
@@ -49,4 +59,13 @@ class CandidateClient:
             
         except Exception as error:
             logging.error(f"Falha na requisição: {error}")
-            raise
\ No newline at end of file
+            raise
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+
+
+# Shared per process so the connection pool (and its TLS sessions) outlives
+# individual requests; import this instead of instantiating CandidateClient.
+candidate_client = CandidateClient()
@@ -3,8 +3,12 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     DATABASE_URL: str
     POOL_SIZE: int = 20          
-    MAX_OVERFLOW: int = 30       
+    MAX_OVERFLOW: int = 10       # conexões extras só durante picos
+    POOL_RECYCLE: int = 3600     # segundos; abaixo do idle timeout do servidor
+    POOL_TIMEOUT: int = 30       
     PORT: int = 3035             
+    DEBUG: bool = False          
+    CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     
     class Config:
         env_file = ".env"
@@ -1,5 +1,9 @@
+from typing import AsyncIterator
 
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -7,20 +11,62 @@ from app.core.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL 
 
+# Compiled-statement cache entries per engine (SQLAlchemy's default is 500)
+QUERY_CACHE_SIZE = 1200
+# Rows per INSERT statement for executemany batches (create_many); the
+# default of 1000 splits large imports into needlessly many round trips
+INSERTMANYVALUES_PAGE_SIZE = 5000
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=30
+    pool_size=settings.POOL_SIZE,
+    max_overflow=settings.MAX_OVERFLOW,
+    pool_recycle=settings.POOL_RECYCLE,
+    pool_timeout=settings.POOL_TIMEOUT,
+    query_cache_size=QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE
+)
+
+# Async engine for request handling: queries await on asyncpg instead of
+# blocking the event loop inside psycopg2
+async_engine = create_async_engine(
+    make_url(SQLALCHEMY_DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_pre_ping=True,
+    pool_size=settings.POOL_SIZE,
+    max_overflow=settings.MAX_OVERFLOW,
+    pool_recycle=settings.POOL_RECYCLE,
+    pool_timeout=settings.POOL_TIMEOUT,
+    query_cache_size=QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE
+)
+
+# expire_on_commit=False: rows returned by INSERT/UPDATE ... RETURNING stay
+# readable after commit without an implicit (and, under asyncio, illegal) lazy reload
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+
+async def get_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    Yield the request's AsyncSession
+
+    Reuses the session opened by db_transaction_middleware, which commits or
+    rolls back once the response is ready; outside of it a fresh session is
+    opened and closed around the dependency.
+    """
+    db = getattr(request.state, "db", None)
+    if db is not None:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+        return
+
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
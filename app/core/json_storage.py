@@ -1,18 +1,39 @@
-import json
+import logging
+import os
+from pathlib import Path
+
+import orjson
 
 
 class JSONStorage:
     def __init__(self, storage_path: str = "data"):
-        self.storage_path: Path(storage_path)
+        self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
 
-    def save_candidates(self, data: list, filename: str = "candidates") -> str:
-        """Save candidates data on JSON file"""
-        try;
+    def save_candidates(self, data: list, filename: str = "candidates", fsync: bool = True) -> str:
+        """
+        Save candidates data on JSON file
+
+        Args:
+            data: Candidates to persist
+            filename: File name without extension
+            fsync: Flush to disk before replacing; callers saving in a tight
+                loop can pass False and only sync the last write of the batch
+
+        Returns:
+            Path of the saved file
+        """
+        try:
             file_path = self.storage_path / f"{filename}.json"
-            with open(file_path, encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            tmp_path = file_path.with_suffix(".json.tmp")
+            # orjson já gera bytes UTF-8, escrita em uma única chamada
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
             self.logger.info(f"Data saved on {file_path}")
             return str(file_path)
 
@@ -26,9 +47,10 @@ class JSONStorage:
             if not file_path.exists():
                 self.logger.warning('Candidate file not found.')
                 return []
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
 
         except Exception as e:
             self.logger.error(f"Erro ao carregar dados: {e}")
+            raise
\ No newline at end of file
@@ -1,5 +1,7 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from app.core.config import settings
 
@@ -20,7 +22,7 @@ class Logger:
         
         file_handler = RotatingFileHandler(
             'logs/medical_records.log',
-            maxBytes=1024*1024*5,  # 5MB
+            maxBytes=1024*1024*50,  # 50MB - rotação menos frequente
             backupCount=5
         )
         file_handler.setFormatter(formatter)
@@ -30,23 +32,33 @@ class Logger:
         console_handler.setFormatter(formatter)
         
         
-        self.logger.addHandler(file_handler)
-        
-        
+        handlers = [file_handler]
         if settings.environment == "development":
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
+        
+        # Escrita e rotação acontecem na thread do listener, fora do event loop
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self._listener.stop)
     
-    def error(self, message: str):
-        self.logger.error(message)
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
     
-    def info(self, message: str):
-        self.logger.info(message)
+    def critical(self, message: str, *args, **kwargs):
+        self.logger.critical(message, *args, **kwargs)
     
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def error(self, message: str, *args, **kwargs):
+        self.logger.error(message, *args, **kwargs)
     
-    def debug(self, message: str):
-        self.logger.debug(message)
-
+    def info(self, message: str, *args, **kwargs):
+        self.logger.info(message, *args, **kwargs)
+    
+    def warning(self, message: str, *args, **kwargs):
+        self.logger.warning(message, *args, **kwargs)
+    
+    def debug(self, message: str, *args, **kwargs):
+        self.logger.debug(message, *args, **kwargs)
 
 logger = Logger()
\ No newline at end of file
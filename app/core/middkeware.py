@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import Request, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.logger import logger
@@ -5,36 +7,38 @@ from app.core.logger import logger
 class CustomMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         # Pré-processamento (antes da requisição)
-        logger.info(f"Incoming request: {request.method} {request.url}")
+        # Formatação adiada: só monta a mensagem se INFO estiver habilitado
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Incoming request: %s %s", request.method, request.url)
         
         try:
             response = await call_next(request)
             
             
-            logger.info(f"Request completed: {response.status_code}")
+            if log_info:
+                logger.info("Request completed: %s", response.status_code)
             return response
             
         except HTTPException as http_exc:
-            logger.error(f"HTTP error: {http_exc.detail}")
+            logger.error("HTTP error: %s", http_exc.detail)
             raise
         except Exception as exc:
-            logger.critical(f"Unexpected error: {str(exc)}")
+            logger.critical("Unexpected error: %s", exc)
             raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
 async def db_transaction_middleware(request: Request, call_next):
     
-    from app.core.database import SessionLocal
-    
-    db = SessionLocal()
-    request.state.db = db  
+    from app.core.database import AsyncSessionLocal
     
-    try:
-        response = await call_next(request)
-        db.commit()
-        return response
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
\ No newline at end of file
+    async with AsyncSessionLocal() as db:
+        request.state.db = db  
+        
+        try:
+            response = await call_next(request)
+            await db.commit()
+            return response
+        except Exception:
+            await db.rollback()
+            raise
\ No newline at end of file
@@ -1,9 +1,44 @@
+import orjson
 import requests
-from typing import Dict, List, Any, Optional, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Any, Optional, Union
 import logging
 from urllib.parse import urljoin
+from uuid import uuid4
+
+
+def cursor_to_arrow(cursor: Any, batch_size: int = 10_000) -> Any:
+    """
+    Drain an executed DB-API cursor into a pyarrow.Table
+
+    Rows are transposed into per-column lists batch by batch, so no dict is
+    built per row and the values are copied once, straight into Arrow.
+
+    Args:
+        cursor: Cursor on which a query has already been executed
+        batch_size: Rows per fetchmany round trip
+
+    Returns:
+        pyarrow.Table with one column per result column
+    """
+    import pyarrow as pa
+
+    names = [col[0] for col in cursor.description]
+    columns: List[List[Any]] = [[] for _ in names]
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for column, values in zip(columns, zip(*rows)):
+            column.extend(values)
+    return pa.table([pa.array(column) for column in columns], names=names)
+
 
 class UniversalDataExtractor:
+    # Rows fetched per round trip by server-side cursors
+    SERVER_CURSOR_ITERSIZE = 10_000
+
     def __init__(self):
         """
         Universal extractor for any type of data
@@ -13,11 +48,19 @@ class UniversalDataExtractor:
         self._setup_session()
 
     def _setup_session(self):
-        """Configure default headers"""
+        """Configure default headers and the pooled transport"""
         self.session.headers.update({
             "Accept": "application/json",
-            "User-Agent": "UniversalExtractor/1.0"
+            "User-Agent": "UniversalExtractor/1.0",
+            "Connection": "keep-alive"
         })
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def from_api(
         self,
@@ -51,7 +94,8 @@ class UniversalDataExtractor:
                 timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            # orjson parses the raw bytes directly, several times faster than requests' json
+            return orjson.loads(response.content)
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API request failed: {e}")
@@ -60,33 +104,91 @@ class UniversalDataExtractor:
     def from_database(
         self,
         query: str,
-        db_connection: Any  # Could be SQLAlchemy, psycopg2, etc.
-    ) -> List[Dict]:
+        db_connection: Any,  # Could be SQLAlchemy, psycopg2, etc.
+        stream: bool = False
+    ) -> Union[List[Dict], Iterator[Dict]]:
         """
         Extract data from any database
         
         Args:
             query: SQL query or similar
             db_connection: Database connection
+            stream: Yield records as they arrive instead of returning a list;
+                on psycopg2 this uses a server-side cursor fetched in batches
             
         Returns:
-            List of records
+            List of records, or an iterator of records when streaming
         """
         try:
-            
-            cursor = db_connection.cursor()
+            cursor = self._open_cursor(db_connection, stream)
             cursor.execute(query)
-            columns = [col[0] for col in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            records = self._iter_records(cursor)
+            return records if stream else list(records)
             
         except Exception as e:
             self.logger.error(f"Database extraction failed: {e}")
             raise
 
+    def from_database_arrow(self, query: str, db_connection: Any) -> Any:
+        """
+        Extract query results straight into a pyarrow.Table
+
+        Args:
+            query: SQL query
+            db_connection: DB-API connection, or a connection URI string to
+                read through connectorx without going through Python
+                objects at all
+
+        Returns:
+            pyarrow.Table with the query results
+        """
+        try:
+            if isinstance(db_connection, str):
+                import connectorx as cx
+                return cx.read_sql(db_connection, query, return_type='arrow')
+
+            cursor = db_connection.cursor()
+            try:
+                cursor.execute(query)
+                return cursor_to_arrow(cursor, self.SERVER_CURSOR_ITERSIZE)
+            finally:
+                cursor.close()
+
+        except Exception as e:
+            self.logger.error(f"Database extraction failed: {e}")
+            raise
+
+    def _open_cursor(self, db_connection: Any, stream: bool) -> Any:
+        """Open a named server-side cursor for psycopg2 streams, a plain one otherwise"""
+        if stream:
+            try:
+                from psycopg2.extensions import connection as PGConnection
+            except ImportError:
+                PGConnection = None
+            if PGConnection is not None and isinstance(db_connection, PGConnection):
+                cursor = db_connection.cursor(name=f"stream_{uuid4().hex}")
+                cursor.itersize = self.SERVER_CURSOR_ITERSIZE
+                return cursor
+        return db_connection.cursor()
+
+    def _iter_records(self, cursor: Any) -> Iterator[Dict]:
+        """Yield rows as dicts and close the cursor once exhausted"""
+        try:
+            columns = None
+            for row in cursor:
+                # Named cursors only fill description after the first fetch
+                if columns is None:
+                    columns = tuple(col[0] for col in cursor.description)
+                yield dict(zip(columns, row))
+        finally:
+            cursor.close()
+
     def from_file(
         self,
         file_path: str,
-        file_type: str = 'json'  # json, csv, parquet, etc.
+        file_type: str = 'json',  # json, csv, parquet, etc.
+        as_arrow: bool = False,
+        stream: bool = False
     ) -> Any:
         """
         Extract data from local/remote files
@@ -94,6 +196,9 @@ class UniversalDataExtractor:
         Args:
             file_path: File path or URL
             file_type: File type (json/csv/parquet)
+            as_arrow: Return a pyarrow.Table instead of Python records (csv only)
+            stream: Yield the items of a top-level JSON array one at a time
+                instead of loading the whole document (json only)
             
         Returns:
             Parsed file contents
@@ -103,8 +208,8 @@ class UniversalDataExtractor:
             Exception: For file loading errors
         """
         file_handlers = {
-            'json': lambda: self._load_json(file_path),
-            'csv': lambda: self._load_csv(file_path),
+            'json': lambda: self._load_json(file_path, stream=stream),
+            'csv': lambda: self._load_csv(file_path, as_arrow=as_arrow),
             
         }
         
@@ -117,16 +222,71 @@ class UniversalDataExtractor:
             self.logger.error(f"File extraction failed: {e}")
             raise
 
-    def _load_json(self, file_path: str) -> Any:
-        """Load JSON file"""
-        import json
-        with open(file_path) as f:
-            return json.load(f)
+    def _load_json(self, file_path: str, stream: bool = False) -> Any:
+        """
+        Load JSON file
+
+        Args:
+            file_path: JSON file path
+            stream: Return a generator over the top-level array instead of
+                parsing the whole file into memory
+
+        Returns:
+            Parsed document, or an iterator of its items when streaming
+        """
+        if stream:
+            return self._iter_json_items(file_path)
+
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def _iter_json_items(self, file_path: str) -> Iterator[Any]:
+        """Yield items of a top-level JSON array without materializing it"""
+        import ijson
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
 
-    def _load_csv(self, file_path: str) -> List[Dict]:
-        """Load CSV file"""
-        import pandas as pd
-        return pd.read_csv(file_path).to_dict('records')
+    def _load_csv(self, file_path: str, as_arrow: bool = False) -> Any:
+        """
+        Load CSV file with Arrow's multi-threaded reader
+
+        Args:
+            file_path: CSV file path
+            as_arrow: Return the pyarrow.Table as-is, skipping the per-cell
+                conversion to Python objects
+
+        Returns:
+            List of records (date/time cells kept as the text in the file, as
+            pandas did), or a pyarrow.Table with inferred types when as_arrow is set
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        def read(column_types: Optional[Dict] = None) -> Any:
+            return pa_csv.read_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(block_size=64 * 1024 * 1024),
+                # Empty cells become nulls, as pandas did, rather than ''
+                convert_options=pa_csv.ConvertOptions(
+                    strings_can_be_null=True,
+                    column_types=column_types
+                )
+            )
+
+        table = read()
+        if as_arrow:
+            return table
+
+        # Arrow infers dates/timestamps; re-read those columns as plain strings
+        # so records carry the original text instead of date/datetime objects
+        temporal = {
+            field.name: pa.string()
+            for field in table.schema
+            if pa.types.is_temporal(field.type)
+        }
+        if temporal:
+            table = read(temporal)
+        return table.to_pylist()
 
     def close(self):
         """Release resources"""
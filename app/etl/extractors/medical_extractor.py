@@ -1,12 +1,15 @@
+import orjson
 import requests
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Union, Any
 import logging
 from urllib.parse import urljoin
 
-from psycopg2 import connect
+from psycopg import connect, sql
 from elasticsearch import Elasticsearch
 from datetime import datetime
 
+from app.etl.extractors.lucas_technology_service_extractor import cursor_to_arrow
+
 class MedicalAppExtractor:
     def __init__(self, 
                  api_base_url: Optional[str] = None,
@@ -81,13 +84,13 @@ class MedicalAppExtractor:
             raise
 
     def get_pg_medical_records(self,
-                             query: str,
+                             query: Union[str, sql.Composable],
                              params: Optional[tuple] = None) -> List[Dict]:
         """
         Extract medical records from PostgreSQL
         
         Args:
-            query: SQL query with parameter placeholders (%s)
+            query: SQL query (or psycopg.sql composable) with %s placeholders
             params: Query parameters
             
         Returns:
@@ -98,13 +101,38 @@ class MedicalAppExtractor:
         
         try:
             with self.pg_conn.cursor() as cursor:
-                cursor.execute(query, params or ())
+                # prepare=True: o servidor reaproveita o plano nas próximas execuções
+                cursor.execute(query, params or (), prepare=True)
                 columns = [col[0] for col in cursor.description]
                 return [dict(zip(columns, row)) for row in cursor.fetchall()]
         except Exception as e:
             self.logger.error(f"PostgreSQL extraction failed: {e}")
             raise
 
+    def get_pg_medical_records_arrow(self,
+                                     query: Union[str, sql.Composable],
+                                     params: Optional[tuple] = None) -> Any:
+        """
+        Extract medical records from PostgreSQL as a pyarrow.Table
+
+        Args:
+            query: SQL query (or psycopg.sql composable) with %s placeholders
+            params: Query parameters
+
+        Returns:
+            pyarrow.Table with the query results
+        """
+        if not self.pg_conn:
+            raise ConnectionError("PostgreSQL not configured")
+
+        try:
+            with self.pg_conn.cursor() as cursor:
+                cursor.execute(query, params or (), prepare=True)
+                return cursor_to_arrow(cursor)
+        except Exception as e:
+            self.logger.error(f"PostgreSQL extraction failed: {e}")
+            raise
+
     
     def _setup_elasticsearch(self, config: Dict):
         """Initialize Elasticsearch client"""
@@ -147,13 +175,64 @@ class MedicalAppExtractor:
             self.logger.error(f"Elasticsearch query failed: {e}")
             raise
 
+    def scroll_es_medical_data(self,
+                               index: str,
+                               query: Dict,
+                               page_size: int = 1000,
+                               keep_alive: str = "1m") -> Iterator[Dict]:
+        """
+        Iterate over every hit of a query using a point-in-time and search_after
+        
+        Args:
+            index: Index/indices to search
+            query: Elasticsearch query DSL (request body, e.g. {"query": {...}})
+            page_size: Hits fetched per request
+            keep_alive: How long the point-in-time is kept between pages
+            
+        Returns:
+            Iterator of hit _source documents
+        """
+        if not self.es_client:
+            raise ConnectionError("Elasticsearch not configured")
+        
+        pit_id = self.es_client.open_point_in_time(index=index, keep_alive=keep_alive)["id"]
+        try:
+            search_after = None
+            while True:
+                body = {
+                    **query,
+                    "size": page_size,
+                    "pit": {"id": pit_id, "keep_alive": keep_alive},
+                    # _shard_doc é o desempate mais barato e estável dentro de um PIT
+                    "sort": [{"_shard_doc": "asc"}]
+                }
+                if search_after is not None:
+                    body["search_after"] = search_after
+                
+                response = self.es_client.search(body=body)
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+                if not hits:
+                    break
+                
+                for hit in hits:
+                    yield hit["_source"]
+                if len(hits) < page_size:
+                    break
+                search_after = hits[-1]["sort"]
+        except Exception as e:
+            self.logger.error(f"Elasticsearch scroll failed: {e}")
+            raise
+        finally:
+            self.es_client.close_point_in_time(id=pit_id)
+
     
     def _fhir_get(self, endpoint: str, params: Dict) -> Dict:
         """Execute FHIR API request"""
         url = urljoin(f"{self.api_base_url}/", endpoint)
         response = self.session.get(url, params=params, timeout=15)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def _process_resource(self, resource: Dict) -> Dict:
         """Standardize FHIR resource format"""
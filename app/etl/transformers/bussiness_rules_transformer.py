@@ -1,9 +1,13 @@
+import time
 from typing import Dict
 import pandas as pd
 from app.etl.extractors.lucas_technology_service_extractor import UniversalDataExtractor
 from app.etl.transformers.data_lake_transformer import DataLakeTransformer
 
 class BusinessRulesTransformer(DataLakeTransformer):
+    # Seconds before cached exchange rates are fetched again
+    EXCHANGE_RATE_TTL = 3600
+
     def __init__(self, extractor: UniversalDataExtractor, rules_config: Dict):
         """
         Applies business rules to transformed data
@@ -17,34 +21,50 @@ class BusinessRulesTransformer(DataLakeTransformer):
         self.rules = rules_config
         # Initialize exchange rates cache
         self._exchange_rates = {}
+        self._exchange_rates_fetched_at = None
 
-    def _get_exchange_rate(self, currency: str) -> float:
+    def _fetch_exchange_rates(self) -> Dict[str, float]:
         """
-        Get exchange rate for target currency (implementation example)
+        Fetch exchange rates from the base currency (implementation example)
         
-        Args:
-            currency: Target currency code (e.g., "USD")
-            
         Returns:
-            Exchange rate from base currency to target currency
+            Mapping of currency code to rate
             
-        Note: In production, you would:
-        - Fetch rates from a financial API
-        - Cache results appropriately
-        - Handle rate lookup failures
+        Note: In production, you would fetch rates from a financial API
+        and handle lookup failures here.
         """
-        
-        rates = {
+        return {
             'USD': 1.0,    # Base currency
             'EUR': 0.85,
             'GBP': 0.75,
             'JPY': 110.0
         }
+
+    def _get_exchange_rate(self, currency: str) -> float:
+        """
+        Get exchange rate for target currency
+        
+        Rates are cached for EXCHANGE_RATE_TTL seconds so a batch of
+        transforms triggers a single fetch.
+        
+        Args:
+            currency: Target currency code (e.g., "USD")
+            
+        Returns:
+            Exchange rate from base currency to target currency
+        """
+        now = time.monotonic()
+        if (
+            self._exchange_rates_fetched_at is None
+            or now - self._exchange_rates_fetched_at > self.EXCHANGE_RATE_TTL
+        ):
+            self._exchange_rates = self._fetch_exchange_rates()
+            self._exchange_rates_fetched_at = now
         
-        if currency not in rates:
+        if currency not in self._exchange_rates:
             raise ValueError(f"Unsupported currency: {currency}")
             
-        return rates[currency]
+        return self._exchange_rates[currency]
 
     def _apply_business_rules(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -71,10 +91,11 @@ class BusinessRulesTransformer(DataLakeTransformer):
         Transform file data with business rules applied
         
         Returns:
-            Dictionary with transformed data and metadata
+            Dictionary with transformed data (as a DataFrame) and metadata;
+            convert with to_dict("records") only where dicts are needed
         """
         data = super().transform_file_data(*args, **kwargs)
         df = pd.DataFrame(data["data"])
-        df = self._apply_business_rules(df)
-        data["data"] = df.to_dict("records")
+        # Mantém o formato colunar; save_to_raw_zone aceita o DataFrame direto
+        data["data"] = self._apply_business_rules(df)
         return data
\ No newline at end of file
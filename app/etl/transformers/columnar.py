@@ -0,0 +1,148 @@
+from datetime import datetime
+from typing import Any, Dict, Iterator, Union
+
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Rows per Parquet row group written by write_parquet
+ROW_GROUP_SIZE = 65536
+
+
+def to_table(df: pd.DataFrame) -> pa.Table:
+    """
+    Convert a transformed DataFrame into the Arrow table transformers return
+
+    Args:
+        df: Transformed DataFrame
+
+    Returns:
+        pyarrow.Table without the pandas index
+    """
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def to_dataframe(data: Any) -> pd.DataFrame:
+    """Accept a Table, DataFrame or list of records and return a DataFrame"""
+    if isinstance(data, pa.Table):
+        return data.to_pandas()
+    if isinstance(data, pd.DataFrame):
+        return data
+    return pd.DataFrame(data)
+
+
+def to_records(data: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield dict records, for consumers that need row-oriented JSON
+
+    Tables are converted one record batch at a time, so only a batch worth
+    of Python dicts exists at once.
+
+    Args:
+        data: pyarrow.Table, DataFrame or list of records
+
+    Returns:
+        Iterator of records
+    """
+    if isinstance(data, pa.Table):
+        for batch in data.to_batches():
+            yield from batch.to_pylist()
+    elif isinstance(data, pd.DataFrame):
+        yield from data.to_dict(orient='records')
+    else:
+        yield from data
+
+
+def _json_default(value: Any) -> Any:
+    # pandas Timestamps are not plain datetimes to orjson; keep them ISO 8601
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def write_metadata(metadata: Dict[str, Any], metadata_path: str) -> None:
+    """Write a metadata sidecar as JSON bytes with orjson"""
+    with open(metadata_path, 'wb') as f:
+        f.write(orjson.dumps(
+            metadata,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        ))
+
+
+def path_timestamp(now: datetime, with_time: bool = True) -> str:
+    """
+    Format a load time as the YYYYMMDD[_HHMMSS] token used in lake paths
+
+    Integer formatting skips strftime's format-string parsing on every save.
+
+    Args:
+        now: Load time, normally datetime.utcnow()
+        with_time: Append _HHMMSS; False gives the date-only token
+
+    Returns:
+        Path-safe timestamp string
+    """
+    date = f"{now.year:04d}{now.month:02d}{now.day:02d}"
+    if not with_time:
+        return date
+    return f"{date}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+
+
+def order_columns_by_size(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reorder columns from smallest to largest in-memory size
+
+    Small columns (ids, flags, short codes) end up adjacent inside each row
+    group, so typical projections read them with fewer, larger I/Os.
+    """
+    sizes = df.memory_usage(index=False, deep=True)
+    return df[sizes.sort_values(kind='stable').index]
+
+
+def parquet_writer(output_path: Any, schema: pa.Schema) -> pq.ParquetWriter:
+    """
+    Open a ParquetWriter with the lake's encoding settings
+
+    zstd level 1 (fast, better ratio than snappy), dictionary encoding and
+    1 MiB data pages. Every Parquet write goes through here so the
+    settings cannot drift between code paths.
+
+    Args:
+        output_path: Destination file path or writable binary buffer
+        schema: Arrow schema of the data to write
+
+    Returns:
+        Open writer; use it as a context manager
+    """
+    return pq.ParquetWriter(
+        output_path,
+        schema,
+        compression='zstd',
+        compression_level=1,
+        use_dictionary=True,
+        data_page_size=1 << 20
+    )
+
+
+def write_parquet(
+    data: Union[pd.DataFrame, pa.Table],
+    output_path: Any,
+    row_group_size: int = ROW_GROUP_SIZE
+) -> None:
+    """
+    Write a DataFrame or Arrow table to Parquet in fixed-size row groups
+
+    Uses the parquet_writer settings, and writes the table slice by slice
+    so each slice becomes exactly one row group.
+
+    Args:
+        data: DataFrame or pyarrow.Table to write
+        output_path: Destination file path or writable binary buffer
+        row_group_size: Rows per row group
+    """
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+    with parquet_writer(output_path, table.schema) as writer:
+        for start in range(0, table.num_rows, row_group_size):
+            writer.write_table(table.slice(start, row_group_size), row_group_size=row_group_size)
\ No newline at end of file
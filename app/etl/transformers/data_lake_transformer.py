@@ -1,13 +1,37 @@
-import json
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 import logging
-import hashlib
+import re
 import pandas as pd
+import pyarrow as pa
 
 from app.etl.extractors.lucas_technology_service_extractor import UniversalDataExtractor
+from app.etl.transformers.columnar import parquet_writer, path_timestamp, write_metadata, write_parquet
+from app.etl.transformers.hashing import fingerprint
+
+# Non-alphanumeric ASCII -> '_' in one C-level pass; non-ASCII goes through _NON_WORD
+_SANITIZE_TBL = str.maketrans({c: '_' for c in map(chr, range(128)) if not c.isalnum()})
+_NON_WORD = re.compile(r'\W')
+
+
+def sanitize_source_name(source_name: str) -> str:
+    """Replace every non-alphanumeric character with '_' for use in paths"""
+    if source_name.isascii():
+        return source_name.translate(_SANITIZE_TBL)
+    # \W is exactly "not isalnum() and not '_'", so this matches the ASCII table
+    return _NON_WORD.sub('_', source_name)
+
 
 class DataLakeTransformer:
+    logger = logging.getLogger(__name__)
+
+    # Fraction of a column allowed to become NaN when coercing to datetime/numeric
+    COERCE_NAN_TOLERANCE = 0.0
+    # Rows per Parquet row group; large enough for efficient scans, small enough for pushdown
+    PARQUET_ROW_GROUP_SIZE = 128 * 1024
+    # Frames above this in-memory size are written to Parquet in row-group slices
+    PARQUET_STREAM_THRESHOLD = 1024 ** 3
+
     def __init__(self, extractor: UniversalDataExtractor):
         """
         Transforms extracted data into raw format suitable for data lakes
@@ -16,18 +40,17 @@ class DataLakeTransformer:
             extractor: Instance of UniversalDataExtractor
         """
         self.extractor = extractor
-        self.logger = logging.getLogger(__name__)
         
     def _generate_metadata(self, data: Any, source: str) -> Dict:
         """Generate standard metadata for all data loads"""
         timestamp = datetime.utcnow().isoformat() + "Z"
-        data_hash = hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        data_hash = fingerprint(data)
         
         return {
             "load_timestamp": timestamp,
             "source_system": source,
             "data_hash": data_hash,
-            "record_count": len(data) if isinstance(data, list) else 1,
+            "record_count": len(data) if isinstance(data, (list, pa.Table)) else 1,
             "schema_version": "1.0"
         }
     
@@ -35,6 +58,8 @@ class DataLakeTransformer:
         """Convert various data formats to pandas DataFrame"""
         if isinstance(data, pd.DataFrame):
             return data
+        elif isinstance(data, pa.Table):
+            return data.to_pandas()
         elif isinstance(data, list):
             return pd.DataFrame(data)
         elif isinstance(data, dict):
@@ -43,23 +68,68 @@ class DataLakeTransformer:
             raise ValueError(f"Unsupported data type: {type(data)}")
     
     def _standardize_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Ensure consistent data types across sources"""
-        for col in df.columns:
-            # Convert string dates to datetime
-            if df[col].dtype == 'object':
-                try:
-                    df[col] = pd.to_datetime(df[col])
-                except (ValueError, TypeError):
-                    pass
-            
-            
-            if df[col].dtype == 'object':
+        """
+        Ensure consistent data types across sources
+
+        Args:
+            df: Frame to standardize
+
+        Returns:
+            DataFrame with datetime/numeric columns converted
+        """
+        # Resolve what can be inferred without parsing in one pass over the frame
+        df = df.infer_objects()
+
+        for col in df.columns[df.dtypes == 'object']:
+            original = df[col]
+            allowed_nans = original.isna().sum() + self.COERCE_NAN_TOLERANCE * len(original)
+            # Coerce once and compare NaN counts instead of raising per column
+            for convert in (pd.to_datetime, pd.to_numeric):
                 try:
-                    df[col] = pd.to_numeric(df[col])
-                except (ValueError, TypeError):
-                    pass
-        
+                    converted = convert(original, errors='coerce')
+                except (ValueError, TypeError, OverflowError):
+                    continue
+                if converted.isna().sum() <= allowed_nans:
+                    df[col] = converted
+                    break
+
         return df
+
+    def _to_records(self, raw_data: Any, standardize_types: bool) -> List[Dict]:
+        """
+        Turn extracted data into records, only going through pandas when needed
+
+        A list of dicts is already in record form, so unless type
+        standardization is requested it is returned as-is instead of being
+        boxed into a DataFrame and flattened straight back.
+        """
+        if (
+            not standardize_types
+            and isinstance(raw_data, list)
+            and (not raw_data or isinstance(raw_data[0], dict))
+        ):
+            return raw_data
+
+        df = self._convert_to_dataframe(raw_data)
+        if standardize_types:
+            df = self._standardize_data_types(df)
+        return df.to_dict(orient='records')
+
+    @staticmethod
+    def _build_result(
+        records: List[Dict],
+        metadata: Dict,
+        raw_data: Any,
+        include_raw: bool
+    ) -> Dict[str, Any]:
+        """Assemble the transform output, attaching raw data only on request"""
+        result = {
+            "data": records,
+            "metadata": metadata
+        }
+        if include_raw:
+            result["raw_data"] = raw_data  # Keep original for traceability
+        return result
     
     def transform_api_data(
         self,
@@ -67,11 +137,17 @@ class DataLakeTransformer:
         endpoint: str,
         params: Optional[Dict] = None,
         headers: Optional[Dict] = None,
-        auth: Optional[tuple] = None
+        auth: Optional[tuple] = None,
+        standardize_types: bool = True,
+        include_raw: bool = False
     ) -> Dict[str, Any]:
         """
         Extract and transform API data for data lake
         
+        Args:
+            standardize_types: Infer datetime/numeric columns through pandas
+            include_raw: Also return the untouched payload under 'raw_data'
+
         Returns:
             Dict with 'data' and 'metadata' keys
         """
@@ -83,27 +159,28 @@ class DataLakeTransformer:
             auth=auth
         )
         
-        df = self._convert_to_dataframe(raw_data)
-        df = self._standardize_data_types(df)
+        records = self._to_records(raw_data, standardize_types)
         
         source_name = f"API:{base_url}{endpoint}"
         metadata = self._generate_metadata(raw_data, source_name)
         
-        return {
-            "data": df.to_dict(orient='records'),
-            "metadata": metadata,
-            "raw_data": raw_data  # Keep original for traceability
-        }
+        return self._build_result(records, metadata, raw_data, include_raw)
     
     def transform_database_data(
         self,
         query: str,
         db_connection: Any,
-        source_name: str
+        source_name: str,
+        standardize_types: bool = True,
+        include_raw: bool = False
     ) -> Dict[str, Any]:
         """
         Extract and transform database data for data lake
         
+        Args:
+            standardize_types: Infer datetime/numeric columns through pandas
+            include_raw: Also return the untouched rows under 'raw_data'
+
         Returns:
             Dict with 'data' and 'metadata' keys
         """
@@ -112,26 +189,27 @@ class DataLakeTransformer:
             db_connection=db_connection
         )
         
-        df = self._convert_to_dataframe(raw_data)
-        df = self._standardize_data_types(df)
+        records = self._to_records(raw_data, standardize_types)
         
         metadata = self._generate_metadata(raw_data, source_name)
         
-        return {
-            "data": df.to_dict(orient='records'),
-            "metadata": metadata,
-            "raw_data": raw_data  # Keep original for traceability
-        }
+        return self._build_result(records, metadata, raw_data, include_raw)
     
     def transform_file_data(
         self,
         file_path: str,
         file_type: str = 'json',
-        source_name: Optional[str] = None
+        source_name: Optional[str] = None,
+        standardize_types: bool = True,
+        include_raw: bool = False
     ) -> Dict[str, Any]:
         """
         Extract and transform file data for data lake
         
+        Args:
+            standardize_types: Infer datetime/numeric columns through pandas
+            include_raw: Also return the untouched file contents under 'raw_data'
+
         Returns:
             Dict with 'data' and 'metadata' keys
         """
@@ -140,20 +218,43 @@ class DataLakeTransformer:
             file_type=file_type
         )
         
-        df = self._convert_to_dataframe(raw_data)
-        df = self._standardize_data_types(df)
+        records = self._to_records(raw_data, standardize_types)
         
         if source_name is None:
             source_name = f"FILE:{file_path}"
         
         metadata = self._generate_metadata(raw_data, source_name)
         
-        return {
-            "data": df.to_dict(orient='records'),
-            "metadata": metadata,
-            "raw_data": raw_data  # Keep original for traceability
-        }
+        return self._build_result(records, metadata, raw_data, include_raw)
     
+    def _write_parquet(self, df: Union[pd.DataFrame, pa.Table], output_path: str) -> None:
+        """
+        Write a DataFrame or Arrow table to Parquet with zstd and fixed row-group sizing
+
+        The Arrow schema is computed once up front; frames larger than
+        PARQUET_STREAM_THRESHOLD are converted and written one row group at a
+        time so the whole frame is never duplicated as an Arrow table.
+        """
+        if isinstance(df, pa.Table):
+            write_parquet(df, output_path, row_group_size=self.PARQUET_ROW_GROUP_SIZE)
+            return
+
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+
+        if df.memory_usage(deep=True).sum() <= self.PARQUET_STREAM_THRESHOLD:
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            write_parquet(table, output_path, row_group_size=self.PARQUET_ROW_GROUP_SIZE)
+            return
+
+        # Same writer settings as write_parquet, so large frames encode like small ones
+        with parquet_writer(output_path, schema) as writer:
+            for start in range(0, len(df), self.PARQUET_ROW_GROUP_SIZE):
+                chunk = df.iloc[start:start + self.PARQUET_ROW_GROUP_SIZE]
+                writer.write_table(
+                    pa.Table.from_pandas(chunk, schema=schema, preserve_index=False),
+                    row_group_size=self.PARQUET_ROW_GROUP_SIZE
+                )
+
     def save_to_raw_zone(
         self,
         transformed_data: Dict[str, Any],
@@ -172,29 +273,31 @@ class DataLakeTransformer:
             Path where data was saved
         """
         try:
-            df = self._convert_to_dataframe(transformed_data['data'])
+            data = transformed_data['data']
             
             # Create timestamped path
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            source_name_clean = "".join(
-                c if c.isalnum() else "_" 
-                for c in transformed_data['metadata']['source_system']
+            timestamp = path_timestamp(datetime.utcnow())
+            source_name_clean = sanitize_source_name(
+                transformed_data['metadata']['source_system']
             )
             output_path = f"{storage_path}/{source_name_clean}/{timestamp}/data.{format}"
             
             
             if format == 'parquet':
-                df.to_parquet(output_path)
+                # Arrow tables from the transformers are written as-is
+                self._write_parquet(
+                    data if isinstance(data, pa.Table) else self._convert_to_dataframe(data),
+                    output_path
+                )
             elif format == 'json':
-                df.to_json(output_path, orient='records', lines=True)
+                self._convert_to_dataframe(data).to_json(output_path, orient='records', lines=True)
             elif format == 'csv':
-                df.to_csv(output_path, index=False)
+                self._convert_to_dataframe(data).to_csv(output_path, index=False)
             else:
                 raise ValueError(f"Unsupported format: {format}")
                         
             metadata_path = f"{storage_path}/{source_name_clean}/{timestamp}/metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(transformed_data['metadata'], f)
+            write_metadata(transformed_data['metadata'], metadata_path)
             
             self.logger.info(f"Data successfully saved to {output_path}")
             return output_path
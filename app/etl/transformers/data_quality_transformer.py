@@ -23,21 +23,11 @@ class DataQualityTransformer(DataLakeTransformer):
         if df.empty:
             raise ValueError("Cannot calculate metrics for empty DataFrame")
             
-        if len(df) == 0:
-            return {
-                "completeness": {},
-                "uniqueness": {}
-            }
-            
+        # One vectorized pass per metric instead of per-column Series calls
+        row_count = len(df)
         return {
-            "completeness": {
-                col: float(1 - df[col].isnull().mean()) 
-                for col in df.columns
-            },
-            "uniqueness": {
-                col: float(df[col].nunique() / max(1, len(df)))  # Avoid division by zero
-                for col in df.columns
-            }
+            "completeness": (1 - df.isnull().mean()).astype(float).to_dict(),
+            "uniqueness": (df.nunique() / row_count).astype(float).to_dict()
         }
 
     def transform_database_data(self, *args, **kwargs) -> Dict[str, Any]:
@@ -47,7 +37,7 @@ class DataQualityTransformer(DataLakeTransformer):
             Dictionary containing:
             - data: Original transformed data
             - metadata: Includes quality_metrics
-            - raw_data: Original raw data
+            - raw_data: Original raw data (only with include_raw=True)
         """
         try:
             data = super().transform_database_data(*args, **kwargs)
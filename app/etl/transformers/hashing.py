@@ -0,0 +1,94 @@
+from hashlib import blake2b, sha256
+from typing import Any, Iterable, Optional
+
+import orjson
+import pandas as pd
+import pyarrow as pa
+
+
+def fingerprint(data: Any) -> str:
+    """
+    Fingerprint a payload without building one big serialized copy
+
+    Lists are hashed record by record and dicts key by key (a list value,
+    such as a FHIR bundle's entries, again item by item), so peak memory
+    stays at the size of a single record; keys are sorted so the hash
+    does not depend on key order.
+
+    Args:
+        data: JSON-like payload, or a pyarrow.Table (hashed like its records)
+
+    Returns:
+        Hex BLAKE2b-128 digest
+    """
+    hasher = blake2b(digest_size=16)
+    if isinstance(data, pa.Table):
+        hasher.update(b"[")
+        # Same bytes as the equivalent list of records, one batch at a time
+        for batch in data.to_batches():
+            for item in batch.to_pylist():
+                hasher.update(orjson.dumps(item, default=str, option=orjson.OPT_SORT_KEYS))
+                hasher.update(b"\n")
+    elif isinstance(data, dict):
+        for key in sorted(data):
+            hasher.update(orjson.dumps(key))
+            hasher.update(b":")
+            _hash_items(hasher, data[key])
+    else:
+        _hash_items(hasher, data)
+    return hasher.hexdigest()
+
+
+def _hash_items(hasher: Any, value: Any) -> None:
+    """Feed a value into the hasher, one serialized item at a time for lists"""
+    if isinstance(value, list):
+        hasher.update(b"[")  # keeps [x] and x from hashing the same
+        for item in value:
+            hasher.update(orjson.dumps(item, default=str, option=orjson.OPT_SORT_KEYS))
+            hasher.update(b"\n")
+    else:
+        hasher.update(orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS))
+        hasher.update(b"\n")
+
+
+def sha256_series(series: pd.Series, mask: Optional[pd.Series] = None) -> pd.Series:
+    """
+    Replace non-null values with the hex SHA-256 of their string form
+
+    Args:
+        series: Column to hash
+        mask: Precomputed notna() mask for the column, if already available
+
+    Returns:
+        New Series with hashed values; nulls are left untouched
+    """
+    if mask is None:
+        mask = series.notna()
+    hashed = series.astype(object)
+    # A comprehension over the non-null values avoids Series.apply's per-call overhead
+    hashed[mask] = [sha256(str(value).encode()).hexdigest() for value in series[mask]]
+    return hashed
+
+
+def hash_columns(df: pd.DataFrame, fields: Iterable[str]) -> pd.DataFrame:
+    """
+    Hash the given columns in place, skipping absent and all-null ones
+
+    Args:
+        df: DataFrame to modify
+        fields: Columns to hash; names missing from df are ignored
+
+    Returns:
+        The same DataFrame with the present fields hashed
+    """
+    present = [field for field in fields if field in df.columns]
+    if not present:
+        return df
+
+    # One null mask for all sensitive columns instead of one per column
+    not_null = df[present].notna()
+    for field in present:
+        mask = not_null[field]
+        if mask.any():
+            df[field] = sha256_series(df[field], mask)
+    return df
\ No newline at end of file
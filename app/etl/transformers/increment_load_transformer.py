@@ -1,6 +1,13 @@
+import logging
+from typing import Any, Dict
+
+import pyarrow.compute as pc
+
 from app.etl.transformers.data_lake_transformer import DataLakeTransformer
 
 class IncrementLoadTransformer(DataLakeTransformer):
+    logger = logging.getLogger(__name__)
+
     def __init__(self, extractor: Any, id_field: str, timestamp_field: str):
         """
         Transformer for handling incremental data loads
@@ -13,7 +20,6 @@ class IncrementLoadTransformer(DataLakeTransformer):
         super().__init__(extractor)
         self.id_field = id_field
         self.timestamp_field = timestamp_field
-        self.logger = logging.getLogger(__name__)
 
     def transform_database_data(self, query: str, db_connection: Any, **kwargs) -> Dict:
         """
@@ -26,23 +32,24 @@ class IncrementLoadTransformer(DataLakeTransformer):
             
         Returns:
             Dictionary containing:
-            - 'data': Transformed records
+            - 'data': Fetched records as a pyarrow.Table
             - 'metadata': Includes incremental load information
         """
         try:
-            raw_data = self.extractor.from_database(query, db_connection)
-            df = pd.DataFrame(raw_data)
+            # Rows go straight into Arrow; no list of dicts or DataFrame in between
+            table = self.extractor.from_database_arrow(query, db_connection)
             
-            # Add incremental load metadata
-            max_timestamp = df[self.timestamp_field].max()
-            record_ids = df[self.id_field].unique().tolist()
+            # Add incremental load metadata, computed by Arrow kernels
+            max_timestamp = pc.max(table[self.timestamp_field]).as_py()
+            # unique() keeps nulls, in order of first appearance
+            record_ids = pc.unique(table[self.id_field]).to_pylist()
             
             transformed_data = {
-                'data': df.to_dict(orient='records'),
+                'data': table,
                 'metadata': {
                     'max_timestamp': str(max_timestamp),
                     'record_ids': record_ids,
-                    **self._generate_metadata(raw_data, source_type='database')
+                    **self._generate_metadata(table, source='database')
                 }
             }
             
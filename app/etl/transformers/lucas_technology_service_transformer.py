@@ -3,13 +3,29 @@ import logging
 import pandas as pd
 from datetime import datetime
 import hashlib
-import json
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
 
 from app.etl.extractors.lucas_technology_service_extractor import UniversalDataExtractor
+from app.etl.transformers.columnar import (
+    ROW_GROUP_SIZE,
+    order_columns_by_size,
+    path_timestamp,
+    write_metadata,
+    write_parquet
+)
+from app.etl.transformers.data_lake_transformer import sanitize_source_name
+
+# Writers for non-partitioned saves, built once instead of per call
+_FORMAT_HANDLERS = {
+    'parquet': lambda df, path: write_parquet(order_columns_by_size(df), path),
+    'json': lambda df, path: df.to_json(path, orient='records', lines=True),
+    'csv': lambda df, path: df.to_csv(path, index=False)
+}
 
 class UniversalDataTransformer:
-    
+    logger = logging.getLogger(__name__)
 
     def save_to_data_lake(
         self,
@@ -35,30 +51,26 @@ class UniversalDataTransformer:
             source_info = transformed_data['source']
             
             
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            timestamp = path_timestamp(datetime.utcnow())
             source_name = source_info.get('source_name', 
                                        source_info.get('endpoint', 'unknown'))
             
             # Clean source name for filesystem
-            source_name_clean = "".join(
-                c if c.isalnum() else "_" for c in str(source_name)
-            )
-            
-            
-            save_handlers = {
-                'partitioned': self._save_partitioned,
-                'non-partitioned': self._save_non_partitioned
-            }
+            source_name_clean = sanitize_source_name(str(source_name))
             
-            handler_key = 'partitioned' if partition_cols else 'non-partitioned'
-            output_path = save_handlers[handler_key](
-                df, storage_path, source_name_clean, format, partition_cols, timestamp
-            )
             
-            
-            metadata_path = output_path.replace(f"data.{format}", "metadata.json")
-            with open(metadata_path, 'w') as f:
-                json.dump(transformed_data['metadata'], f)
+            if partition_cols:
+                output_path = self._save_partitioned(
+                    df, storage_path, source_name_clean, format, partition_cols, timestamp
+                )
+                # Leading underscore keeps dataset readers from treating it as data
+                metadata_path = f"{output_path}/_metadata_{timestamp}.json"
+            else:
+                output_path = self._save_non_partitioned(
+                    df, storage_path, source_name_clean, format, partition_cols, timestamp
+                )
+                metadata_path = output_path.replace(f"data.{format}", "metadata.json")
+            write_metadata(transformed_data['metadata'], metadata_path)
             
             self.logger.info(f"Data successfully saved to {output_path}")
             return output_path
@@ -76,17 +88,32 @@ class UniversalDataTransformer:
         partition_cols: List[str],
         timestamp: str
     ) -> str:
-        """Save data with partitioning"""
+        """
+        Save data as a hive-partitioned Parquet dataset
         
-        partition_values = [
-            f"{col}={df[col].iloc[0]}" 
-            for col in partition_cols 
-            if col in df.columns
-        ]
+        Arrow splits the frame by every distinct partition key combination in
+        a single pass; files are named after the load timestamp so repeated
+        loads add files next to earlier ones instead of replacing them.
         
-        output_path = f"{storage_path}/{source_name_clean}/{'/'.join(partition_values)}/data.{format}"
-        df.drop(columns=partition_cols).to_parquet(output_path)
-        return output_path
+        Returns:
+            Base directory of the dataset
+        """
+        partition_cols = [col for col in partition_cols if col in df.columns]
+        base_dir = f"{storage_path}/{source_name_clean}"
+        
+        file_format = ds.ParquetFileFormat()
+        ds.write_dataset(
+            pa.Table.from_pandas(order_columns_by_size(df), preserve_index=False),
+            base_dir=base_dir,
+            format=file_format,
+            file_options=file_format.make_write_options(compression='zstd', compression_level=1),
+            partitioning=partition_cols,
+            partitioning_flavor='hive',
+            basename_template=f"data_{timestamp}_{{i}}.parquet",
+            max_rows_per_group=ROW_GROUP_SIZE,
+            existing_data_behavior='overwrite_or_ignore'
+        )
+        return base_dir
 
     def _save_non_partitioned(
         self,
@@ -100,16 +127,9 @@ class UniversalDataTransformer:
         """Save data without partitioning"""
         output_path = f"{storage_path}/{source_name_clean}/{timestamp}/data.{format}"
         
-        
-        format_handlers = {
-            'parquet': lambda: df.to_parquet(output_path),
-            'json': lambda: df.to_json(output_path, orient='records', lines=True),
-            'csv': lambda: df.to_csv(output_path, index=False)
-        }
-        
-        handler = format_handlers.get(format)
+        handler = _FORMAT_HANDLERS.get(format)
         if not handler:
             raise ValueError(f"Unsupported format: {format}")
-        handler()
+        handler(df, output_path)
         
         return output_path
\ No newline at end of file
@@ -3,10 +3,62 @@ import logging
 import pandas as pd
 from datetime import datetime
 from dateutil.parser import parse
-import hashlib
-import json
+import pyarrow as pa
+
+from app.etl.transformers.columnar import (
+    path_timestamp,
+    to_dataframe,
+    to_table,
+    write_metadata,
+    write_parquet
+)
+from app.etl.transformers.hashing import fingerprint, hash_columns
+
+
+# FHIR field extractors: one comprehension per column instead of Series.apply
+def _extract_name(series: pd.Series) -> List[Any]:
+    return [
+        ' '.join([n['given'][0] for n in x if 'given' in n]) if isinstance(x, list) else x
+        for x in series
+    ]
+
+
+def _extract_telecom(series: pd.Series, system: str) -> List[Any]:
+    return [
+        next((t['value'] for t in x if t['system'] == system), None) if isinstance(x, list) else None
+        for x in series
+    ]
+
+
+def _extract_address(series: pd.Series) -> List[Any]:
+    return [
+        ', '.join(filter(None, [
+            x[0].get('line', [''])[0],
+            x[0].get('city', ''),
+            x[0].get('state', ''),
+            x[0].get('postalCode', '')
+        ])) if isinstance(x, list) and len(x) > 0 else None
+        for x in series
+    ]
+
+
+def _extract_coding(series: pd.Series, key: str) -> List[Any]:
+    return [x['coding'][0][key] if isinstance(x, dict) and 'coding' in x else None for x in series]
+
+
+def _extract_quantity(series: pd.Series, key: str) -> List[Any]:
+    return [x.get(key) if isinstance(x, dict) else None for x in series]
 
 class MedicalDataTransformer:
+    logger = logging.getLogger(__name__)
+
+    # Standard FHIR code systems
+    FHIR_CODE_SYSTEMS = {
+        'loinc': 'http://loinc.org',
+        'snomed': 'http://snomed.info/sct',
+        'icd10': 'http://hl7.org/fhir/sid/icd-10'
+    }
+
     def __init__(self, extractor: Any, anonymize_fields: Optional[List[str]] = None):
         """
         Medical data transformer for FHIR, PostgreSQL, and Elasticsearch sources
@@ -16,15 +68,7 @@ class MedicalDataTransformer:
             anonymize_fields: List of fields to anonymize (e.g., ['patient_id', 'name'])
         """
         self.extractor = extractor
-        self.logger = logging.getLogger(__name__)
         self.anonymize_fields = anonymize_fields or []
-        
-        # Standard FHIR code systems
-        self.fhir_code_systems = {
-            'loinc': 'http://loinc.org',
-            'snomed': 'http://snomed.info/sct',
-            'icd10': 'http://hl7.org/fhir/sid/icd-10'
-        }
 
     def transform_fhir_data(self, resource_type: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -36,7 +80,7 @@ class MedicalDataTransformer:
             
         Returns:
             Dictionary with keys:
-            - 'data': Transformed records
+            - 'data': Transformed records as a pyarrow.Table
             - 'metadata': Extraction metadata
             - 'source': Source information
         """
@@ -55,7 +99,7 @@ class MedicalDataTransformer:
             df = self._anonymize_data(df)
             
             return {
-                'data': df.to_dict(orient='records'),
+                'data': to_table(df),
                 'metadata': self._generate_metadata(raw_data, source_type='fhir'),
                 'source': {
                     'type': 'fhir',
@@ -77,13 +121,14 @@ class MedicalDataTransformer:
             
         Returns:
             Dictionary with keys:
-            - 'data': Transformed records
+            - 'data': Transformed records as a pyarrow.Table
             - 'metadata': Extraction metadata
             - 'source': Source information
         """
         try:
-            raw_data = self.extractor.get_pg_medical_records(query, params)
-            df = pd.DataFrame(raw_data)
+            table = self.extractor.get_pg_medical_records_arrow(query, params)
+            # split_blocks avoids consolidating columns into one 2D block copy
+            df = table.to_pandas(split_blocks=True)
             
             # Standardize common medical fields
             if 'birth_date' in df.columns:
@@ -95,8 +140,8 @@ class MedicalDataTransformer:
             df = self._anonymize_data(df)
             
             return {
-                'data': df.to_dict(orient='records'),
-                'metadata': self._generate_metadata(raw_data, source_type='postgresql'),
+                'data': to_table(df),
+                'metadata': self._generate_metadata(table, source_type='postgresql'),
                 'source': {
                     'type': 'postgresql',
                     'query': query,
@@ -118,24 +163,19 @@ class MedicalDataTransformer:
             
         Returns:
             Dictionary with keys:
-            - 'data': Transformed records
+            - 'data': Transformed records as a pyarrow.Table
             - 'metadata': Extraction metadata
             - 'source': Source information
         """
         try:
             raw_data = self.extractor.get_es_medical_data(index, query, size)
-            df = pd.DataFrame(raw_data)
-            
-            
-            for col in df.columns:
-                if isinstance(df[col].iloc[0], dict):
-                    df = pd.concat([df.drop([col], axis=1), pd.json_normalize(df[col])], axis=1)
+            df = self._flatten_es_records(raw_data)
             
             df = self._standardize_data_types(df)
             df = self._anonymize_data(df)
             
             return {
-                'data': df.to_dict(orient='records'),
+                'data': to_table(df),
                 'metadata': self._generate_metadata(raw_data, source_type='elasticsearch'),
                 'source': {
                     'type': 'elasticsearch',
@@ -148,87 +188,79 @@ class MedicalDataTransformer:
             self.logger.error(f"Elasticsearch transformation failed: {e}")
             raise
 
+    def _flatten_es_records(self, records: List[Dict]) -> pd.DataFrame:
+        """
+        Load ES documents into a flat DataFrame, nested objects as 'parent.child' columns
+        
+        Arrow infers the nested structs in one pass and flatten() explodes
+        them in C; documents whose shapes Arrow cannot unify fall back to
+        pd.json_normalize. ES documents are sparse, so the columns are the
+        union of every document's keys (from_pylist would only take the first's).
+        """
+        try:
+            keys = dict.fromkeys(key for record in records for key in record)
+            table = pa.table({key: [record.get(key) for record in records] for key in keys})
+            while any(pa.types.is_struct(field.type) for field in table.schema):
+                table = table.flatten()
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return pd.json_normalize(records)
+
     def _transform_patient_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize FHIR Patient resources"""
+        columns = {}
         if 'name' in df.columns:
-            df['name'] = df['name'].apply(
-                lambda x: ' '.join([n['given'][0] for n in x if 'given' in n]) if isinstance(x, list) else x
-            )
+            columns['name'] = _extract_name(df['name'])
         
         if 'telecom' in df.columns:
-            df['phone'] = df['telecom'].apply(
-                lambda x: next((t['value'] for t in x if t['system'] == 'phone'), None) if isinstance(x, list) else None
-            )
-            df['email'] = df['telecom'].apply(
-                lambda x: next((t['value'] for t in x if t['system'] == 'email'), None) if isinstance(x, list) else None
-            )
+            columns['phone'] = _extract_telecom(df['telecom'], 'phone')
+            columns['email'] = _extract_telecom(df['telecom'], 'email')
         
         if 'address' in df.columns:
-            df['address'] = df['address'].apply(
-                lambda x: ', '.join(filter(None, [
-                    x[0].get('line', [''])[0],
-                    x[0].get('city', ''),
-                    x[0].get('state', ''),
-                    x[0].get('postalCode', '')
-                ])) if isinstance(x, list) and len(x) > 0 else None
-            )
+            columns['address'] = _extract_address(df['address'])
         
-        return df
+        return df.assign(**columns)
 
     def _transform_observation_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize FHIR Observation resources"""
+        columns = {}
         if 'code' in df.columns:
-            df['code_system'] = df['code'].apply(
-                lambda x: x['coding'][0]['system'] if isinstance(x, dict) and 'coding' in x else None
-            )
-            df['code_value'] = df['code'].apply(
-                lambda x: x['coding'][0]['code'] if isinstance(x, dict) and 'coding' in x else None
-            )
+            columns['code_system'] = _extract_coding(df['code'], 'system')
+            columns['code_value'] = _extract_coding(df['code'], 'code')
         
         if 'valueQuantity' in df.columns:
-            df['value'] = df['valueQuantity'].apply(
-                lambda x: x.get('value') if isinstance(x, dict) else None
-            )
-            df['unit'] = df['valueQuantity'].apply(
-                lambda x: x.get('unit') if isinstance(x, dict) else None
-            )
+            columns['value'] = _extract_quantity(df['valueQuantity'], 'value')
+            columns['unit'] = _extract_quantity(df['valueQuantity'], 'unit')
         
         if 'effectiveDateTime' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['effectiveDateTime'], errors='coerce')
+            columns['timestamp'] = pd.to_datetime(df['effectiveDateTime'], errors='coerce')
         
-        return df
+        return df.assign(**columns)
 
     def _standardize_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ensure consistent data types across sources"""
         
-        date_cols = [col for col in df.columns if any(kw in col.lower() for kw in ['date', 'time'])]
-        for col in date_cols:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
-        
+        date_cols = [col for col in df.columns if any(kw in col.lower() for kw in ('date', 'time'))]
+        if date_cols:
+            df[date_cols] = df[date_cols].apply(pd.to_datetime, errors='coerce')
         
-        for col in df.select_dtypes(include='object').columns:
+        # Date columns are datetime64 by now, so this only sees the remaining object columns
+        for col in df.columns[df.dtypes == 'object']:
             try:
-                df[col] = pd.to_numeric(df[col], errors='ignore')
-            except Exception:
+                df[col] = pd.to_numeric(df[col])
+            except (ValueError, TypeError):
                 pass
         
         return df
 
     def _anonymize_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Anonymize sensitive fields"""
-        for field in self.anonymize_fields:
-            if field in df.columns:
-                df[field] = df[field].apply(
-                    lambda x: hashlib.sha256(str(x).encode()).hexdigest() if pd.notnull(x) else x
-                )
-        return df
+        return hash_columns(df, self.anonymize_fields)
 
     def _generate_metadata(self, data: Any, source_type: str) -> Dict[str, Any]:
         """Generate standardized metadata for all transformations"""
         timestamp = datetime.utcnow().isoformat() + "Z"
-        data_hash = hashlib.md5(
-            json.dumps(data, sort_keys=True, default=str).encode()
-        ).hexdigest()
+        data_hash = fingerprint(data)
         
         return {
             "transform_timestamp": timestamp,
@@ -251,28 +283,28 @@ class MedicalDataTransformer:
             Path where data was saved
         """
         try:
-            df = pd.DataFrame(transformed_data['data'])
+            data = transformed_data['data']
             source_info = transformed_data['source']
             
             
-            date_str = datetime.utcnow().strftime("%Y%m%d")
+            date_str = path_timestamp(datetime.utcnow(), with_time=False)
             resource_type = source_info.get('resource_type', source_info.get('index', 'unknown'))
             output_path = f"{storage_path}/{source_info['type']}/{resource_type}/{date_str}/data.{format}"
             
             
             if format == 'parquet':
-                df.to_parquet(output_path)
+                # Tables go straight to Parquet without a pandas round-trip
+                write_parquet(data if isinstance(data, pa.Table) else to_dataframe(data), output_path)
             elif format == 'json':
-                df.to_json(output_path, orient='records', lines=True)
+                to_dataframe(data).to_json(output_path, orient='records', lines=True)
             elif format == 'csv':
-                df.to_csv(output_path, index=False)
+                to_dataframe(data).to_csv(output_path, index=False)
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
             
             metadata_path = output_path.replace(f"data.{format}", "metadata.json")
-            with open(metadata_path, 'w') as f:
-                json.dump(transformed_data['metadata'], f)
+            write_metadata(transformed_data['metadata'], metadata_path)
             
             self.logger.info(f"Data successfully saved to {output_path}")
             return output_path
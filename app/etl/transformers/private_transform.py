@@ -1,12 +1,16 @@
+import logging
 
-import hashlib
 import pandas as pd
-from typing import Dict, List
+from typing import Any, Dict, List
 from app.etl.extractors.lucas_technology_service_extractor import UniversalDataExtractor
+from app.etl.transformers.columnar import to_table
 from app.etl.transformers.data_lake_transformer import DataLakeTransformer
+from app.etl.transformers.hashing import hash_columns
 
 
 class PrivateTransform(DataLakeTransformer):
+    logger = logging.getLogger(__name__)
+
     def __init__(self, extractor: UniversalDataExtractor, sensitive_fields: List[str]):
         """
         Transformer for handling sensitive data by hashing specified fields
@@ -15,8 +19,7 @@ class PrivateTransform(DataLakeTransformer):
             extractor: Instance of UniversalDataExtractor
             sensitive_fields: List of field names containing sensitive data
         """
-        super().__init__()
-        self.extractor = extractor
+        super().__init__(extractor)
         self.sensitive_fields = sensitive_fields
         
     def hash_sensitive_data(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -28,12 +31,7 @@ class PrivateTransform(DataLakeTransformer):
         Returns:
             DataFrame with sensitive fields hashed
         """
-        for field in self.sensitive_fields:
-            if field in df.columns:
-                df[field] = df[field].apply(
-                    lambda x: hashlib.sha256(str(x).encode()).hexdigest() if pd.notnull(x) else x
-                )
-        return df
+        return hash_columns(df, self.sensitive_fields)
     
     def transform_database_data(self, query: str, db_connection: Any, **kwargs) -> Dict:
         """
@@ -46,13 +44,14 @@ class PrivateTransform(DataLakeTransformer):
             
         Returns:
             Dictionary containing:
-            - 'data': Transformed records with hashed sensitive fields
+            - 'data': pyarrow.Table with hashed sensitive fields
             - 'metadata': Transformation metadata
         """
         try:
             
-            raw_data = self.extractor.from_database(query, db_connection)
-            df = pd.DataFrame(raw_data)
+            table = self.extractor.from_database_arrow(query, db_connection)
+            # split_blocks avoids consolidating columns into one 2D block copy
+            df = table.to_pandas(split_blocks=True)
             
             
             df = self.hash_sensitive_data(df)
@@ -61,8 +60,8 @@ class PrivateTransform(DataLakeTransformer):
             df = self._standardize_data_types(df)
             
             return {
-                'data': df.to_dict(orient='records'),
-                'metadata': self._generate_metadata(raw_data, source_type='database')
+                'data': to_table(df),
+                'metadata': self._generate_metadata(table, source='database')
             }
             
         except Exception as e:
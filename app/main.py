@@ -1,13 +1,16 @@
 import logging
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.utils import get_openapi
 from fastapi.staticfiles import StaticFiles
 from app.core.config import settings
 from app.core.middleware import CustomMiddleware, db_transaction_middleware
 from app.routes import records, imports, exports, health
 from app.core.security import verify_api_key  # Importe a função de autenticação
+from app.candidate_client import candidate_client
 
 
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +24,7 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down Medical Records Microservice")
+    candidate_client.close()
 
 
 app = FastAPI(
@@ -28,7 +32,8 @@ app = FastAPI(
     description="Microservice for importing/exporting medical records from different healthcare organizations",
     version="1.0.0",
     lifespan=lifespan,
-    dependencies=[Depends(verify_api_key)]  # Autenticação global
+    # orjson serializa UUID/datetime/Enum nativamente, bem mais rápido que o json padrão
+    default_response_class=ORJSONResponse
 )
 
 
@@ -45,10 +50,12 @@ app.add_middleware(
 )
 
 
+# Autenticação só nos routers protegidos; health checks não passam por verify_api_key
+protected = [Depends(verify_api_key)]
 app.include_router(health.router, tags=["Health"])
-app.include_router(records.router, prefix="/records", tags=["Records"])
-app.include_router(imports.router, prefix="/import", tags=["Imports"])
-app.include_router(exports.router, prefix="/export", tags=["Exports"])
+app.include_router(records.router, prefix="/records", tags=["Records"], dependencies=protected)
+app.include_router(imports.router, prefix="/import", tags=["Imports"], dependencies=protected)
+app.include_router(exports.router, prefix="/export", tags=["Exports"], dependencies=protected)
 
 # Documentação OpenAPI customizada
 def custom_openapi():
@@ -74,9 +81,13 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        app,
+        "app.main:app",  # Import string: necessário para workers e reload
         host="0.0.0.0",
         port=settings.PORT,  # Porta configurável via settings
         log_level="info",
+        # Um processo por núcleo (menos um) em produção; reload só funciona com 1 worker
+        workers=1 if settings.DEBUG else max(1, (os.cpu_count() or 2) - 1),
+        loop="uvloop",
+        http="httptools",
         reload=settings.DEBUG  # Recarregamento automático em desenvolvimento
     )
\ No newline at end of file
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, JSON, text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
 from app.schemas.imports import ImportStatus
@@ -7,13 +7,35 @@ import uuid  # Adicione esta importação
 
 class ImportJob(Base):
     __tablename__ = "import_jobs"
+    __table_args__ = (
+        # Filtros mais comuns: jobs de uma origem por status e de um destino por data
+        Index('ix_import_jobs_source_status', 'source_org_id', 'status'),
+        Index('ix_import_jobs_dest_created', 'destination_org_id', 'created_at'),
+        # Fila de pendentes: índice parcial pequeno, só com as linhas ainda não processadas
+        Index(
+            'ix_import_jobs_pending_created',
+            'created_at',
+            postgresql_where=text("status = 'PENDING'")
+        ),
+        # Contagem de imports ativos: um índice parcial por lado do OR (BitmapOr)
+        Index(
+            'ix_import_jobs_source_active',
+            'source_org_id',
+            postgresql_where=text("status IN ('PENDING', 'PROCESSING')")
+        ),
+        Index(
+            'ix_import_jobs_dest_active',
+            'destination_org_id',
+            postgresql_where=text("status IN ('PENDING', 'PROCESSING')")
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, 
                default=uuid.uuid4, server_default=text("gen_random_uuid()"))
     source_org_id = Column(UUID(as_uuid=True), nullable=False)
     destination_org_id = Column(UUID(as_uuid=True), nullable=False)
     status = Column(Enum(ImportStatus), nullable=False, default=ImportStatus.PENDING)
-    parameters = Column(JSON, nullable=False)
+    parameters = Column(JSONB, nullable=False)
     created_by = Column(UUID(as_uuid=True), nullable=False)
     callback_url = Column(String)
     records_processed = Column(Integer, default=0)
@@ -1,11 +1,20 @@
-from sqlalchemy import Boolean, Column, DateTime, JSON, text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 from app.core.database import Base  # Certifique-se que esta é sua Base correta
 import uuid
 
 class MedicalRecord(Base):
     __tablename__ = "medical_records"
+    __table_args__ = (
+        # GIN para consultas de contenção (@>) dentro do prontuário
+        Index(
+            'idx_medical_records_record_data',
+            'record_data',
+            postgresql_using='gin',
+            postgresql_ops={'record_data': 'jsonb_path_ops'}
+        ),
+    )
     
     id = Column(
         UUID(as_uuid=True),
@@ -25,7 +34,7 @@ class MedicalRecord(Base):
         nullable=False  # Adicionei nullable=False pois parece ser obrigatório
     )
     record_data = Column(
-        JSON,
+        JSONB,
         nullable=False  # Assumindo que é obrigatório
     )
     created_at = Column(
@@ -44,4 +53,10 @@ class MedicalRecord(Base):
         default=False,  # Valor padrão no Python
         server_default=text('false'),  # Valor padrão no banco de dados
         nullable=False
+    )
+    is_active = Column(
+        Boolean,
+        default=True,
+        server_default=text('true'),
+        nullable=False  # False = removido (soft delete)
     )
\ No newline at end of file
@@ -1,15 +1,38 @@
 import uuid
-from sqlalchemy import JSON, Column, DateTime, Enum, text  # Added text import
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, Enum, Index, text  # Added text import
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
 from app.schemas.transfer import TransferStatus
 
 class Transfer(Base):
     __tablename__ = "transfer_logs"
-    __table_args__ = {
-        'comment': 'Audit log for medical record transfers between organizations'
-    }
+    __table_args__ = (
+        Index('ix_transfers_record_status', 'record_id', 'status'),
+        Index('ix_transfers_dest_created', 'destination_org_id', 'created_at'),
+        Index(
+            'ix_transfers_pending_created',
+            'created_at',
+            postgresql_where=text("status = 'PENDING'")
+        ),
+        # Containment (@>, @?) lookups on the JSONB payloads (migration c3d9a1f27b64)
+        Index(
+            'ix_transfer_logs_audit_log_gin',
+            'audit_log',
+            postgresql_using='gin',
+            postgresql_ops={'audit_log': 'jsonb_path_ops'}
+        ),
+        Index(
+            'ix_transfer_logs_parameters_gin',
+            'parameters',
+            postgresql_using='gin',
+            postgresql_ops={'parameters': 'jsonb_path_ops'}
+        ),
+        # Scalar key filters, e.g. parameters->>'priority' = 'high' (migration e81f4b0a9d25)
+        Index('ix_transfer_logs_params_priority', text("(parameters->>'priority')")),
+        Index('ix_transfer_logs_audit_actor', text("(audit_log->>'actor')")),
+        {'comment': 'Audit log for medical record transfers between organizations'}
+    )
     
     id = Column(
         UUID(as_uuid=True),
@@ -61,19 +84,19 @@ class Transfer(Base):
         comment="Timestamp when transfer was completed"
     )
     parameters = Column(
-        JSON,
+        JSONB,
         nullable=False,
         default=dict,
         server_default=text("'{}'::jsonb"),  # Explicit jsonb type
         comment="Configuration parameters for the transfer"
     )
     error_details = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Error details if transfer failed"
     )
     audit_log = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Complete audit trail for compliance"
     )
@@ -1,70 +1,109 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.import_job import ImportJob
+from app.repositories.pagination import Cursor, before_cursor, cursor_params, next_cursor
 from app.schemas.imports import ImportStatus
 
+# Statements built once; only the bound values change between calls
+_ORG_FILTER = or_(
+    ImportJob.source_org_id == bindparam("organization_id"),
+    ImportJob.destination_org_id == bindparam("organization_id")
+)
+
+_LIST_BY_ORG_STMT = (
+    select(ImportJob)
+    .where(_ORG_FILTER)
+    .order_by(ImportJob.created_at.desc(), ImportJob.id.desc())
+    .limit(bindparam("limit"))
+)
+_LIST_BY_ORG_BEFORE_STMT = _LIST_BY_ORG_STMT.where(before_cursor(ImportJob))
+
+_ACTIVE_COUNT_STMT = (
+    select(func.count())
+    .select_from(ImportJob)
+    .where(
+        _ORG_FILTER,
+        # Rendered inline so the planner can prove the partial indexes'
+        # predicate even with a generic prepared-statement plan
+        ImportJob.status.in_(bindparam(
+            "active_statuses",
+            [ImportStatus.PENDING, ImportStatus.PROCESSING],
+            expanding=True,
+            literal_execute=True
+        ))
+    )
+)
+
 class ImportJobRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, import_job: ImportJob) -> ImportJob:
-        """Create a new importing job"""
-        self.db.add(import_job)
-        self.db.commit()
-        self.db.refresh(import_job)
+    async def create(self, values: Dict[str, Any]) -> ImportJob:
+        """Create a new importing job, reading server defaults back in the same round trip"""
+        result = await self.db.execute(insert(ImportJob).values(**values).returning(ImportJob))
+        import_job = result.scalar_one()
+        await self.db.commit()
         return import_job
 
-    def get_by_id(self, job_id: UUID) -> Optional[ImportJob]:
-        """Get a job by ID"""
-        return self.db.query(ImportJob).filter(ImportJob.id == job_id).first()
+    async def create_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Create several jobs with one executemany (batched by insertmanyvalues)"""
+        if not rows:
+            return
+        await self.db.execute(insert(ImportJob), rows)
+        await self.db.commit()
+
+    async def get_by_id(self, job_id: UUID) -> Optional[ImportJob]:
+        """Get a job by ID; repeated lookups in the same request come from the session's identity map"""
+        return await self.db.get(ImportJob, job_id)
 
-    def update_status(
+    async def update_status(
         self, 
         job_id: UUID, 
         status: ImportStatus,
         message: Optional[str] = None
     ) -> Optional[ImportJob]:
-        """Update job status"""
-        job = self.get_by_id(job_id)
-        if job:
-            job.status = status
-            if message:
-                job.message = message
-            self.db.commit()
-            self.db.refresh(job)
+        """Update job status in a single UPDATE ... RETURNING round trip"""
+        values = {"status": status}
+        if message:
+            values["message"] = message
+        result = await self.db.execute(
+            update(ImportJob)
+            .where(ImportJob.id == job_id)
+            .values(values)
+            .returning(ImportJob)
+            .execution_options(populate_existing=True)
+        )
+        job = result.scalar_one_or_none()
+        await self.db.commit()
         return job
 
-    def list_by_organization(
+    async def list_by_organization(
         self, 
         organization_id: UUID,
         limit: int = 100,
-        offset: int = 0
-    ) -> List[ImportJob]:
-        """List job by Organization"""
-        return (
-            self.db.query(ImportJob)
-            .filter(
-                (ImportJob.source_org_id == organization_id) |
-                (ImportJob.destination_org_id == organization_id)
-            )
-            .order_by(ImportJob.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-            .all()
+        before: Optional[Cursor] = None
+    ) -> Tuple[List[ImportJob], Optional[Cursor]]:
+        """
+        List one page of an Organization's jobs, newest first
+
+        Args:
+            organization_id: Source or destination organization
+            limit: Maximum jobs per page
+            before: Cursor returned by the previous page; None for the first page
+
+        Returns:
+            Jobs of the page and the cursor for the next one (None on the last page)
+        """
+        stmt = _LIST_BY_ORG_STMT if before is None else _LIST_BY_ORG_BEFORE_STMT
+        result = await self.db.execute(
+            stmt, cursor_params({"organization_id": organization_id, "limit": limit}, before)
         )
+        jobs = result.scalars().all()
+        return jobs, next_cursor(jobs, limit)
 
-    def get_active_imports_count(self, organization_id: UUID) -> int:
+    async def get_active_imports_count(self, organization_id: UUID) -> int:
         """Conts imports by Organization"""
-        return (
-            self.db.query(ImportJob)
-            .filter(
-                ((ImportJob.source_org_id == organization_id) |
-                 (ImportJob.destination_org_id == organization_id)),
-                ImportJob.status.in_([
-                    ImportStatus.PENDING,
-                    ImportStatus.PROCESSING
-                ])
-            )
-            .count()
-        )
\ No newline at end of file
+        result = await self.db.execute(_ACTIVE_COUNT_STMT, {"organization_id": organization_id})
+        return result.scalar_one()
\ No newline at end of file
@@ -1,96 +1,191 @@
+from functools import lru_cache
 from uuid import UUID
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.medical_record import MedicalRecord
+from app.repositories.pagination import Cursor, before_cursor, cursor_params, next_cursor
 from app.schemas.medical_record import MedicalRecordCreate, MedicalRecordUpdate
 from app.core.logger import logger
 from datetime import datetime
 
+# Statements built once; only the bound values change between calls
+# Newest first; id breaks created_at ties so the keyset cursor is unambiguous
+_NEWEST_FIRST = (MedicalRecord.created_at.desc(), MedicalRecord.id.desc())
+
+_BY_PATIENT_STMT = (
+    select(MedicalRecord)
+    .where(MedicalRecord.patient_id == bindparam("patient_id"))
+    .order_by(*_NEWEST_FIRST)
+    .limit(bindparam("limit"))
+)
+_BY_PATIENT_BEFORE_STMT = _BY_PATIENT_STMT.where(before_cursor(MedicalRecord))
+
+_BY_ORGANIZATION_STMT = (
+    select(MedicalRecord)
+    .where(MedicalRecord.organization_id == bindparam("organization_id"))
+    .order_by(*_NEWEST_FIRST)
+    .limit(bindparam("limit"))
+)
+_BY_ORGANIZATION_BEFORE_STMT = _BY_ORGANIZATION_STMT.where(before_cursor(MedicalRecord))
+
+# Search filters, in (parameter name, criterion) form
+_SEARCH_FILTERS = (
+    ("patient_id", MedicalRecord.patient_id == bindparam("patient_id")),
+    ("organization_id", MedicalRecord.organization_id == bindparam("organization_id")),
+    ("start_date", MedicalRecord.created_at >= bindparam("start_date")),
+    ("end_date", MedicalRecord.created_at <= bindparam("end_date")),
+    ("is_anonymous", MedicalRecord.is_anonymous == bindparam("is_anonymous")),
+)
+
+
+@lru_cache(maxsize=2 ** (len(_SEARCH_FILTERS) + 1))
+def _search_stmt(mask: tuple, paged: bool):
+    """Build the search statement once per combination of active filters and cursor"""
+    stmt = select(MedicalRecord)
+    for active, (_, criterion) in zip(mask, _SEARCH_FILTERS):
+        if active:
+            stmt = stmt.where(criterion)
+    if paged:
+        stmt = stmt.where(before_cursor(MedicalRecord))
+    return stmt.order_by(*_NEWEST_FIRST).limit(bindparam("limit"))
+
 class MedicalRecordRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create(self, record_data: MedicalRecordCreate) -> Optional[MedicalRecord]:
         """Cria um novo prontuário médico"""
         try:
-            db_record = MedicalRecord(
-                **record_data.dict(exclude_unset=True),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+            # created_at/updated_at come from the columns' server_default (now())
+            result = await self.db.execute(
+                insert(MedicalRecord)
+                .values(**record_data.model_dump(exclude_unset=True))
+                .returning(MedicalRecord)
             )
-            self.db.add(db_record)
-            self.db.commit()
-            self.db.refresh(db_record)
+            db_record = result.scalar_one()
+            await self.db.commit()
             return db_record
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error creating medical record: {e}")
             return None
 
+    async def create_many(self, records: List[MedicalRecordCreate]) -> int:
+        """Cria vários prontuários em um único executemany"""
+        if not records:
+            return 0
+        try:
+            rows = [record.model_dump(exclude_unset=True) for record in records]
+            # insertmanyvalues agrupa as linhas em poucos INSERTs multi-VALUES
+            await self.db.execute(insert(MedicalRecord), rows)
+            await self.db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Error creating medical records: {e}")
+            return 0
+
     async def get_by_id(self, record_id: UUID) -> Optional[MedicalRecord]:
         """Obtém um prontuário pelo ID"""
         try:
-            return self.db.query(MedicalRecord).filter(MedicalRecord.id == record_id).first()
+            # Identity map: a record already loaded in this request is returned without a SELECT
+            return await self.db.get(MedicalRecord, record_id)
         except SQLAlchemyError as e:
             logger.error(f"Error fetching record {record_id}: {e}")
             return None
 
-    async def get_by_patient(self, patient_id: UUID) -> List[MedicalRecord]:
-        """Obtém todos os prontuários de um paciente"""
+    async def get_by_patient(
+        self,
+        patient_id: UUID,
+        limit: int = 100,
+        before: Optional[Cursor] = None
+    ) -> Tuple[List[MedicalRecord], Optional[Cursor]]:
+        """
+        Obtém uma página de prontuários de um paciente, do mais recente ao mais antigo
+
+        Args:
+            patient_id: Patient to list records for
+            limit: Maximum records per page
+            before: Cursor returned by the previous page; None for the first page
+
+        Returns:
+            Records of the page and the cursor for the next one (None on the last page)
+        """
         try:
-            return self.db.query(MedicalRecord)\
-                .filter(MedicalRecord.patient_id == patient_id)\
-                .order_by(MedicalRecord.created_at.desc())\
-                .all()
+            stmt = _BY_PATIENT_STMT if before is None else _BY_PATIENT_BEFORE_STMT
+            result = await self.db.execute(
+                stmt, cursor_params({"patient_id": patient_id, "limit": limit}, before)
+            )
+            records = result.scalars().all()
+            return records, next_cursor(records, limit)
         except SQLAlchemyError as e:
             logger.error(f"Error fetching records for patient {patient_id}: {e}")
-            return []
+            return [], None
+
+    async def get_by_organization(
+        self,
+        org_id: UUID,
+        limit: int = 100,
+        before: Optional[Cursor] = None
+    ) -> Tuple[List[MedicalRecord], Optional[Cursor]]:
+        """
+        Obtém uma página de prontuários de uma organização, do mais recente ao mais antigo
 
-    async def get_by_organization(self, org_id: UUID) -> List[MedicalRecord]:
-        """Obtém todos os prontuários de uma organização"""
+        Args:
+            org_id: Organization to list records for
+            limit: Maximum records per page
+            before: Cursor returned by the previous page; None for the first page
+
+        Returns:
+            Records of the page and the cursor for the next one (None on the last page)
+        """
         try:
-            return self.db.query(MedicalRecord)\
-                .filter(MedicalRecord.organization_id == org_id)\
-                .order_by(MedicalRecord.created_at.desc())\
-                .all()
+            stmt = _BY_ORGANIZATION_STMT if before is None else _BY_ORGANIZATION_BEFORE_STMT
+            result = await self.db.execute(
+                stmt, cursor_params({"organization_id": org_id, "limit": limit}, before)
+            )
+            records = result.scalars().all()
+            return records, next_cursor(records, limit)
         except SQLAlchemyError as e:
             logger.error(f"Error fetching records for organization {org_id}: {e}")
-            return []
+            return [], None
 
     async def update(self, record_id: UUID, update_data: MedicalRecordUpdate) -> Optional[MedicalRecord]:
         """Atualiza um prontuário existente"""
         try:
-            db_record = self.get_by_id(record_id)
-            if not db_record:
-                return None
-
-            update_data = update_data.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_record, field, value)
-            
-            db_record.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(db_record)
+            # Um único UPDATE ... RETURNING em vez de SELECT + UPDATE + refresh
+            result = await self.db.execute(
+                update(MedicalRecord)
+                .where(MedicalRecord.id == record_id)
+                # updated_at is set by the column's onupdate=func.now()
+                .values(**update_data.model_dump(exclude_unset=True))
+                .returning(MedicalRecord)
+                .execution_options(populate_existing=True)
+            )
+            db_record = result.scalar_one_or_none()
+            await self.db.commit()
             return db_record
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error updating record {record_id}: {e}")
             return None
 
     async def delete(self, record_id: UUID) -> bool:
-        """Remove um prontuário (soft delete)"""
+        """Remove um prontuário (soft delete) em um único UPDATE ... RETURNING"""
         try:
-            db_record = self.get_by_id(record_id)
-            if not db_record:
-                return False
-
-            db_record.is_active = False
-            db_record.updated_at = datetime.utcnow()
-            self.db.commit()
-            return True
+            result = await self.db.execute(
+                update(MedicalRecord)
+                .where(MedicalRecord.id == record_id)
+                .values(is_active=False)
+                .returning(MedicalRecord.id)
+            )
+            deleted = result.scalar_one_or_none() is not None
+            await self.db.commit()
+            return deleted
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error deleting record {record_id}: {e}")
             return False
 
@@ -100,24 +195,34 @@ class MedicalRecordRepository:
         organization_id: Optional[UUID] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        is_anonymous: Optional[bool] = None
-    ) -> List[MedicalRecord]:
-        """Busca avançada de prontuários com filtros"""
+        is_anonymous: Optional[bool] = None,
+        limit: int = 100,
+        before: Optional[Cursor] = None
+    ) -> Tuple[List[MedicalRecord], Optional[Cursor]]:
+        """Busca avançada de prontuários com filtros, paginada por cursor (created_at, id)"""
         try:
-            query = self.db.query(MedicalRecord)
+            values = (patient_id, organization_id, start_date, end_date, is_anonymous)
+            # is_anonymous=False is a real filter; the others are skipped when falsy
+            mask = (
+                bool(patient_id),
+                bool(organization_id),
+                bool(start_date),
+                bool(end_date),
+                is_anonymous is not None
+            )
+            params = {
+                name: value
+                for (name, _), value, active in zip(_SEARCH_FILTERS, values, mask)
+                if active
+            }
             
-            if patient_id:
-                query = query.filter(MedicalRecord.patient_id == patient_id)
-            if organization_id:
-                query = query.filter(MedicalRecord.organization_id == organization_id)
-            if start_date:
-                query = query.filter(MedicalRecord.created_at >= start_date)
-            if end_date:
-                query = query.filter(MedicalRecord.created_at <= end_date)
-            if is_anonymous is not None:
-                query = query.filter(MedicalRecord.is_anonymous == is_anonymous)
+            params["limit"] = limit
             
-            return query.order_by(MedicalRecord.created_at.desc()).all()
+            result = await self.db.execute(
+                _search_stmt(mask, before is not None), cursor_params(params, before)
+            )
+            records = result.scalars().all()
+            return records, next_cursor(records, limit)
         except SQLAlchemyError as e:
             logger.error(f"Error searching records: {e}")
-            return []
\ No newline at end of file
+            return [], None
\ No newline at end of file
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import bindparam, tuple_
+
+# Keyset cursor: (created_at, id) of the last row of the previous page
+Cursor = Tuple[datetime, UUID]
+
+
+def before_cursor(model):
+    """
+    Criterion for rows strictly older than the cursor, in (created_at DESC, id DESC) order
+
+    Unlike OFFSET, the database seeks straight to the cursor through the
+    created_at indexes, so every page costs the same regardless of depth.
+    """
+    return tuple_(model.created_at, model.id) < tuple_(
+        bindparam("before_created_at"),
+        bindparam("before_id")
+    )
+
+
+def cursor_params(params: Dict[str, Any], before: Optional[Cursor]) -> Dict[str, Any]:
+    """Add the cursor bind values to params when paging past the first page"""
+    if before is not None:
+        params["before_created_at"], params["before_id"] = before
+    return params
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> Optional[Cursor]:
+    """Cursor for the following page, or None when this page was the last one"""
+    if len(rows) < limit:
+        return None
+    return rows[-1].created_at, rows[-1].id
\ No newline at end of file
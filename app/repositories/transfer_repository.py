@@ -1,72 +1,145 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import bindparam, inspect, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from app.models.transfer import TransferLog
+from app.repositories.pagination import Cursor, before_cursor, cursor_params, next_cursor
 from app.schemas.transfer import TransferStatus
 
+# List views only need these; the JSONB payloads (parameters, error_details,
+# audit_log) stay deferred and are loaded by get_transfer when needed
+_LIST_COLUMNS = load_only(
+    TransferLog.id,
+    TransferLog.record_id,
+    TransferLog.source_org_id,
+    TransferLog.destination_org_id,
+    TransferLog.status,
+    TransferLog.created_at,
+    TransferLog.completed_at
+)
+
+# Statements built once; only the bound values change between calls
+_BY_RECORD_STMT = (
+    select(TransferLog)
+    .options(_LIST_COLUMNS)
+    .where(TransferLog.record_id == bindparam("record_id"))
+    .order_by(TransferLog.created_at.desc(), TransferLog.id.desc())
+    .limit(bindparam("limit"))
+)
+_BY_RECORD_BEFORE_STMT = _BY_RECORD_STMT.where(before_cursor(TransferLog))
+
+_BY_ORG_STMT = (
+    select(TransferLog)
+    .options(_LIST_COLUMNS)
+    .where(or_(
+        TransferLog.source_org_id == bindparam("org_id"),
+        TransferLog.destination_org_id == bindparam("org_id")
+    ))
+    .order_by(TransferLog.created_at.desc(), TransferLog.id.desc())
+    .limit(bindparam("limit"))
+)
+
+_BY_ORG_AND_STATUS_STMT = _BY_ORG_STMT.where(TransferLog.status == bindparam("status"))
+
+# Indexed by (status filtered, cursor given)
+_ORG_STMTS = {
+    (False, False): _BY_ORG_STMT,
+    (True, False): _BY_ORG_AND_STATUS_STMT,
+    (False, True): _BY_ORG_STMT.where(before_cursor(TransferLog)),
+    (True, True): _BY_ORG_AND_STATUS_STMT.where(before_cursor(TransferLog)),
+}
+
 class TransferRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_transfer(self, transfer: TransferLog) -> TransferLog:
-        """Register a new transfer"""
-        self.db.add(transfer)
-        self.db.commit()
-        self.db.refresh(transfer)
+    async def create_transfer(self, values: Dict[str, Any]) -> TransferLog:
+        """Register a new transfer, reading server defaults back in the same round trip"""
+        result = await self.db.execute(insert(TransferLog).values(**values).returning(TransferLog))
+        transfer = result.scalar_one()
+        await self.db.commit()
         return transfer
 
-    def get_transfer(self, transfer_id: UUID) -> Optional[TransferLog]:
-        """Get a transfer by ID"""
-        return self.db.query(TransferLog).filter(TransferLog.id == transfer_id).first()
+    async def get_transfer(self, transfer_id: UUID) -> Optional[TransferLog]:
+        """
+        Get a transfer by ID with every column loaded
+
+        Repeated lookups in the same request come from the session's identity
+        map. That may be an object a listing loaded with only _LIST_COLUMNS,
+        whose deferred JSONB columns cannot be lazy-loaded under AsyncSession,
+        so whatever is still unloaded is refreshed here.
+        """
+        transfer = await self.db.get(TransferLog, transfer_id)
+        if transfer is not None:
+            unloaded = inspect(transfer).unloaded
+            if unloaded:
+                await self.db.refresh(transfer, attribute_names=list(unloaded))
+        return transfer
 
-    def update_transfer_status(
+    async def update_transfer_status(
         self,
         transfer_id: UUID,
         status: TransferStatus,
         details: Optional[str] = None
     ) -> Optional[TransferLog]:
-        """Update status from a transfer"""
-        transfer = self.get_transfer(transfer_id)
-        if transfer:
-            transfer.status = status
-            if details:
-                transfer.details = details
-            self.db.commit()
-            self.db.refresh(transfer)
+        """Update status from a transfer in a single UPDATE ... RETURNING round trip"""
+        values = {"status": status}
+        if details:
+            values["error_details"] = details
+        result = await self.db.execute(
+            update(TransferLog)
+            .where(TransferLog.id == transfer_id)
+            .values(values)
+            .returning(TransferLog)
+            .execution_options(populate_existing=True)
+        )
+        transfer = result.scalar_one_or_none()
+        await self.db.commit()
         return transfer
 
-    def get_transfers_by_record(
+    async def get_transfers_by_record(
         self,
         record_id: UUID,
-        limit: int = 100
-    ) -> List[TransferLog]:
-        """List transfers for a medical record"""
-        return (
-            self.db.query(TransferLog)
-            .filter(TransferLog.record_id == record_id)
-            .order_by(TransferLog.created_at.desc())
-            .limit(limit)
-            .all()
+        limit: int = 100,
+        before: Optional[Cursor] = None
+    ) -> Tuple[List[TransferLog], Optional[Cursor]]:
+        """
+        List one page of transfers for a medical record, newest first
+
+        Only the list columns are loaded; the JSONB columns are deferred and,
+        under AsyncSession, must not be accessed on the returned objects.
+
+        Args:
+            record_id: Medical record the transfers belong to
+            limit: Maximum transfers per page
+            before: Cursor returned by the previous page; None for the first page
+
+        Returns:
+            Transfers of the page and the cursor for the next one (None on the last page)
+        """
+        stmt = _BY_RECORD_STMT if before is None else _BY_RECORD_BEFORE_STMT
+        result = await self.db.execute(
+            stmt, cursor_params({"record_id": record_id, "limit": limit}, before)
         )
+        transfers = result.scalars().all()
+        return transfers, next_cursor(transfers, limit)
 
-    def get_organization_transfers(
+    async def get_organization_transfers(
         self,
         org_id: UUID,
         status: Optional[TransferStatus] = None,
-        limit: int = 100
-    ) -> List[TransferLog]:
-        """List transfers from an Organization"""
-        query = self.db.query(TransferLog).filter(
-            (TransferLog.source_org_id == org_id) |
-            (TransferLog.destination_org_id == org_id)
-        )
+        limit: int = 100,
+        before: Optional[Cursor] = None
+    ) -> Tuple[List[TransferLog], Optional[Cursor]]:
+        """List one page of transfers from an Organization (list columns only), with the next page's cursor"""
+        params = {"org_id": org_id, "limit": limit}
         
         if status:
-            query = query.filter(TransferLog.status == status)
+            params["status"] = status
             
-        return (
-            query.order_by(TransferLog.created_at.desc())
-            .limit(limit)
-            .all()
-        )
\ No newline at end of file
+        result = await self.db.execute(
+            _ORG_STMTS[bool(status), before is not None], cursor_params(params, before)
+        )
+        transfers = result.scalars().all()
+        return transfers, next_cursor(transfers, limit)
\ No newline at end of file
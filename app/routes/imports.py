@@ -1,16 +1,18 @@
+import asyncio
 import uuid
 from typing import Annotated
-from fastapi import APIRouter, Depends, BackgroundTasks, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.security import APIKeyHeader
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 from app.schemas.imports import ImportRequest, ImportResponse, ImportStatus
 from app.services.import_service import ImportService
 from app.core.database import get_db
 from app.core.security import verify_api_key
 from app.core.logger import logger
-from app.models.import_job import ImportJob
-from app.workers.import_worker import process_import_job
+from app.repositories.import_job_repository import ImportJobRepository
+from app.workers.tasks import process_import_job
 
 router = APIRouter(prefix="/imports", tags=["Medical Records Import"])
 
@@ -26,50 +28,47 @@ API_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
 async def import_records(
     
     request: ImportRequest,
-    background_tasks: BackgroundTasks,
     
     # Then parameters with defaults
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     api_key: str = Depends(verify_api_key)
 ) -> ImportResponse:
     """
     Initiate medical records import from external healthcare organization
     """
     try:
-        import_service = ImportService(db)
-        if not import_service.verify_organization_access(
-            api_key, 
-            request.source_org_id,
-            request.destination_org_id
-        ):
+        # ImportService is shared with the sync worker; run it on the session's sync facade
+        has_access = await db.run_sync(
+            lambda session: ImportService(session).verify_organization_access(
+                api_key,
+                request.source_org_id,
+                request.destination_org_id
+            )
+        )
+        if not has_access:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Organization not authorized"
             )
 
         job_id = uuid.uuid4()
-        new_job = ImportJob(
-            id=job_id,
-            source_org_id=request.source_org_id,
-            destination_org_id=request.destination_org_id,
-            status=ImportStatus.PENDING,
-            parameters=request.parameters,
-            callback_url=request.callback_url,
-            created_by=request.created_by,
-            records_processed=0,
-            message="Job queued"
-        )
-        
-        db.add(new_job)
-        db.commit()
+        await ImportJobRepository(db).create({
+            "id": job_id,
+            "source_org_id": request.source_org_id,
+            "destination_org_id": request.destination_org_id,
+            "status": ImportStatus.PENDING,
+            "parameters": request.parameters,
+            "callback_url": request.callback_url,
+            "created_by": request.created_by,
+            "records_processed": 0,
+            "message": "Job queued"
+        })
         
         logger.info("Import job created", extra={"job_id": str(job_id)})
 
-        background_tasks.add_task(
-            process_import_job,
-            job_id=job_id,
-            db_url=str(db.bind.url)
-        )
+        # Fila durável: o job sobrevive a restarts e roda fora do worker web.
+        # delay() publica no broker de forma bloqueante, então sai do event loop
+        await asyncio.to_thread(process_import_job.delay, str(job_id))
 
         return ImportResponse(
             job_id=job_id,
@@ -82,7 +81,7 @@ async def import_records(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Import failed: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -100,23 +99,26 @@ async def get_import_status(
     job_id: uuid.UUID,
     
     # Then parameters with defaults
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     api_key: str = Depends(verify_api_key)
 ) -> ImportResponse:
     """
     Check status of an import job
+
+    Polled frequently, so the response is validated once here and handed
+    straight to orjson instead of being re-validated against response_model.
     """
-    job = db.query(ImportJob).filter(ImportJob.id == job_id).first()
+    job = await ImportJobRepository(db).get_by_id(job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Import job not found"
         )
     
-    return ImportResponse(
+    return ORJSONResponse(ImportResponse(
         job_id=job.id,
         status=job.status,
         status_url=f"/imports/status/{job_id}",
         records_processed=job.records_processed,
         message=job.message or "Job in progress"
-    )
\ No newline at end of file
+    ).model_dump())
\ No newline at end of file
@@ -1,7 +1,7 @@
 from enum import Enum
 from datetime import datetime
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from uuid import UUID
 
 class TransferStatus(str, Enum):
@@ -30,7 +30,8 @@ class TransferCreate(TransferBase):
     callback_url: Optional[str] = Field(None, description="Callback URL for notifications")
     initiated_by: UUID = Field(..., description="User/system initiating the transfer")
 
-    @validator('parameters')
+    @field_validator('parameters')
+    @classmethod
     def validate_parameters(cls, v):
         if not isinstance(v, dict):
             raise ValueError("Parameters must be a dictionary")
@@ -50,8 +51,7 @@ class TransferInDBBase(TransferBase):
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
     audit_log: Optional[List[Dict]] = Field(None, description="Audit trail for compliance")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Transfer(TransferInDBBase):
     """Complete transfer schema for API responses"""
@@ -1,43 +1,109 @@
-import requests
+import httpx
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 import multiprocessing
-from functools import partial
+
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import redis.asyncio as redis
+
+# Campos do Next.js mapeados explicitamente; o resto vai para _originalData
+_MAPPED_FIELDS = ['id', 'firstName', 'lastName', 'email', 
+                  'telephone', 'city', 'state', 'country', 'cpf',
+                  'createdAt', 'updatedAt']
+# O(1) membership for building _originalData; _MAPPED_FIELDS keeps the column order
+_KNOWN_KEYS = frozenset(_MAPPED_FIELDS)
+_REQUIRED_FIELDS = ['id', 'firstName', 'lastName', 'cpf']
+# Fields whose Arrow kernels (case mapping, \D) only match str methods on
+# ASCII, e.g. 'ß'.title() or Arabic-Indic digits; non-ASCII values there go
+# through _process_candidate. Strip-only fields agree on all of Unicode.
+_ASCII_ONLY_FIELDS = ['email', 'telephone', 'state', 'country']
+# Chave já em strip().lower()
+_COUNTRY_ALIAS = {"br": "Brasil", "brasil": "Brasil", "brazil": "Brasil"}
+_BRAZIL_UFS = frozenset({
+    "AC", "AL", "AP", "AM", "BA", "CE", "DF", "ES", "GO", "MA", "MT", "MS", "MG", "PA",
+    "PB", "PR", "PE", "PI", "RJ", "RN", "RS", "RO", "RR", "SC", "SP", "SE", "TO",
+})
+# Strings already in the form datetime.isoformat() produces; parsing and
+# re-formatting them is the identity (zero microseconds and -00:00 are excluded
+# because isoformat() would drop / rewrite them)
+_CANONICAL_ISO = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}'
+    r'(?:\.(?!000000)[0-9]{6})?'
+    r'(?:\+[0-9]{2}:[0-9]{2}|-(?!00:00)[0-9]{2}:[0-9]{2})?'
+)
+# Drops every ASCII non-digit in one C-level pass
+_KEEP_DIGITS = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if not c.isdigit()))
+
+# Cache de busca por sobrenome; a entrada sobrevive ao TTL por esta janela para
+# que o ETag ainda permita revalidar com um 304 em vez de baixar tudo de novo
+_CACHE_KEY_PREFIX = "candidates:lastname:"
+_CACHE_REVALIDATE_WINDOW = 24 * 3600
+
+# Loggers are not picklable; worker processes log through this one
+_worker_logger = logging.getLogger(__name__)
+
+
+def _init_worker(level: int) -> None:
+    """Configure logging once per worker process"""
+    logging.basicConfig(level=level)
+
+
+def _process_batch_in_worker(batch: List[Dict]) -> List[Dict]:
+    """Module-level entry point so the pool can pickle it by reference"""
+    return CandidateDataService._process_batch(batch, logger=_worker_logger)
+
 
 class CandidateDataService:
     def __init__(self, 
                  base_api_url: str,
                  poll_interval: int = 60,
-                 max_workers: int = None):
+                 max_workers: int = None,
+                 redis_url: Optional[str] = None,
+                 cache_ttl: int = 300):
         """
         Initialize the data service with configurable parallel processing
         
         Args:
             base_api_url: Base URL of the Next.js API
             poll_interval: Seconds between polling for new data
-            max_workers: Number of parallel workers (defaults to CPU count * 2)
+            max_workers: Number of worker processes (defaults to CPU count)
+            redis_url: Redis for caching fetches by last name; None disables the cache
+            cache_ttl: Seconds a cached fetch is served without asking the API
         """
         self.base_api_url = base_api_url.rstrip('/')
         self.poll_interval = poll_interval
-        self.max_workers = max_workers or multiprocessing.cpu_count() * 2
+        self.max_workers = max_workers or multiprocessing.cpu_count()
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
-        self._setup_session()
+        # Um único cliente por serviço: o pool de conexões é reaproveitado entre buscas
+        self.client = httpx.AsyncClient(
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": "CandidateDataService/1.0"
+            },
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30
+            ),
+            timeout=httpx.Timeout(10)
+        )
+        self.cache_ttl = cache_ttl
+        self.cache = redis.Redis.from_url(redis_url) if redis_url else None
         self.logger.info(f"Initialized with {self.max_workers} workers")
 
-    def _setup_session(self):
-        """Configure common headers for API requests"""
-        self.session.headers.update({
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": "CandidateDataService/1.0"
-        })
-
-    def fetch_candidates_by_lastname(self, last_name: str) -> List[Dict]:
+    async def fetch_candidates_by_lastname(self, last_name: str) -> List[Dict]:
         """
         Fetch candidates from Next.js API by last name
+
+        Fresh cached results are returned without a request; expired ones are
+        revalidated with If-None-Match, so an unchanged list costs a 304.
         
         Args:
             last_name: Last name to search for
@@ -46,52 +112,113 @@ class CandidateDataService:
             List of candidate dictionaries
         """
         try:
+            cached = await self._cache_get(last_name)
+            if cached and cached["expires"] > time.time():
+                self.logger.info(f"Cache hit for last name '{last_name}'")
+                return cached["data"]
+
             url = f"{self.base_api_url}/candidates/{last_name}"
             self.logger.info(f"Fetching candidates from: {url}")
             
-            response = self.session.get(
-                url,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            candidates = response.json()
+            kwargs = {}
+            if cached and cached["etag"]:
+                kwargs["headers"] = {"If-None-Match": cached["etag"]}
+            response = await self.client.get(url, **kwargs)
+
+            if response.status_code == 304:
+                candidates = cached["data"]
+                etag = response.headers.get("ETag", cached["etag"])
+            else:
+                response.raise_for_status()
+                candidates = response.json()
+                etag = response.headers.get("ETag")
+            await self._cache_set(last_name, candidates, etag)
+
             self.logger.info(f"Found {len(candidates)} candidates for last name '{last_name}'")
             return candidates
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"API request failed for last name '{last_name}': {e}")
             raise
         except Exception as e:
             self.logger.error(f"Unexpected error fetching candidates: {e}")
             raise
 
-    def process_candidates(self, raw_candidates: List[Dict], batch_size: int = 100) -> List[Dict]:
+    async def invalidate_lastname(self, last_name: str) -> None:
+        """Drop the cached fetch for a last name after a known write upstream"""
+        if self.cache is None:
+            return
+        try:
+            await self.cache.delete(f"{_CACHE_KEY_PREFIX}{last_name}")
+        except redis.RedisError as e:
+            self.logger.warning(f"Cache invalidation failed for last name '{last_name}': {e}")
+
+    async def _cache_get(self, last_name: str) -> Optional[Dict]:
+        """Cached entry ({data, etag, expires}) or None; cache errors count as a miss"""
+        if self.cache is None:
+            return None
+        try:
+            raw = await self.cache.get(f"{_CACHE_KEY_PREFIX}{last_name}")
+        except redis.RedisError as e:
+            self.logger.warning(f"Cache read failed for last name '{last_name}': {e}")
+            return None
+        return orjson.loads(raw) if raw else None
+
+    async def _cache_set(self, last_name: str, candidates: List[Dict], etag: Optional[str]) -> None:
+        """Store a fetch; a failing cache never fails the fetch itself"""
+        if self.cache is None:
+            return
+        entry = {"data": candidates, "etag": etag, "expires": time.time() + self.cache_ttl}
+        try:
+            await self.cache.set(
+                f"{_CACHE_KEY_PREFIX}{last_name}",
+                orjson.dumps(entry),
+                ex=self.cache_ttl + _CACHE_REVALIDATE_WINDOW
+            )
+        except redis.RedisError as e:
+            self.logger.warning(f"Cache write failed for last name '{last_name}': {e}")
+
+    async def aclose(self) -> None:
+        """Release pooled connections; call on application shutdown"""
+        await self.client.aclose()
+        if self.cache is not None:
+            await self.cache.aclose()
+
+    def process_candidates(self, raw_candidates: List[Dict], batch_size: int = 5000) -> List[Dict]:
         """
         Process candidates with automatic batch parallelization
+
+        Cleaning is CPU-bound, so batches run in worker processes rather than
+        threads; a single batch is processed inline to skip the pool start-up.
         
         Args:
             raw_candidates: List of raw candidate dictionaries
-            batch_size: Number of candidates per batch (default 100)
+            batch_size: Number of candidates per batch (default 5000); batches
+                are cleaned column-wise, so larger ones amortize the setup
             
         Returns:
-            List of processed candidates with error handling
+            List of processed candidates with error handling, in input order
         """
         if not raw_candidates:
             return []
 
+        batches = [
+            raw_candidates[i:i + batch_size] 
+            for i in range(0, len(raw_candidates), batch_size)
+        ]
+        if len(batches) == 1:
+            return self._process_batch(batches[0], logger=self.logger)
+
         # Process in parallel batches
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            batches = [
-                raw_candidates[i:i + batch_size] 
-                for i in range(0, len(raw_candidates), batch_size)
-            ]
-            
-            process_func = partial(self._process_batch, logger=self.logger)
-            futures = [executor.submit(process_func, batch) for batch in batches]
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(batches)),
+            initializer=_init_worker,
+            initargs=(self.logger.getEffectiveLevel(),)
+        ) as executor:
+            futures = [executor.submit(_process_batch_in_worker, batch) for batch in batches]
             
             results = []
-            for future in as_completed(futures):
+            for future in futures:
                 try:
                     results.extend(future.result())
                 except Exception as e:
@@ -101,11 +228,43 @@ class CandidateDataService:
 
     @staticmethod
     def _process_batch(batch: List[Dict], logger: logging.Logger = None) -> List[Dict]:
-        """Process a single batch of candidates"""
+        """
+        Process a single batch of candidates column by column
+
+        Candidates whose mapped fields are all strings (or null) are cleaned
+        with Arrow string kernels over the whole batch; any other candidate
+        (a missing name, a numeric field) goes through _process_candidate,
+        which reports it exactly as before.
+
+        Args:
+            batch: Raw candidates
+            logger: Logger for per-candidate failures
+
+        Returns:
+            Processed candidates (or error entries), in input order
+        """
+        cleaned = CandidateDataService._clean_batch(batch)
+        processed_at = datetime.now().isoformat()
+
         processed = []
-        for candidate in batch:
+        for candidate, record in zip(batch, cleaned):
             try:
-                processed.append(CandidateDataService._process_candidate(candidate))
+                if record is None or not (
+                    isinstance(candidate.get("firstName"), str)
+                    and isinstance(candidate.get("lastName"), str)
+                ):
+                    processed.append(CandidateDataService._process_candidate(candidate))
+                    continue
+                for field in _REQUIRED_FIELDS:
+                    if not record[field]:
+                        raise ValueError(f"Missing required field: {field}")
+                record["createdAt"] = CandidateDataService._parse_date(candidate.get("createdAt"))
+                record["updatedAt"] = CandidateDataService._parse_date(candidate.get("updatedAt"))
+                record["processedAt"] = processed_at
+                record["_originalData"] = {
+                    k: v for k, v in candidate.items() if k not in _KNOWN_KEYS
+                }
+                processed.append(record)
             except Exception as e:
                 if logger:
                     logger.warning(f"Error processing candidate {candidate.get('id')}: {e}")
@@ -116,14 +275,104 @@ class CandidateDataService:
                 })
         return processed
 
+    @staticmethod
+    def _clean_batch(batch: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Clean a batch column-wise
+
+        None marks candidates the vectorized path would clean differently
+        (non-string fields, non-ASCII values in _ASCII_ONLY_FIELDS); those are
+        left to _process_candidate.
+        """
+        regular = [
+            all(value is None or isinstance(value, str) for value in map(candidate.get, _MAPPED_FIELDS))
+            and all(value is None or value.isascii() for value in map(candidate.get, _ASCII_ONLY_FIELDS))
+            for candidate in batch
+        ]
+        if all(regular):
+            return CandidateDataService._clean_columns(batch)
+        cleaned = iter(CandidateDataService._clean_columns(
+            [candidate for candidate, ok in zip(batch, regular) if ok]
+        ))
+        return [next(cleaned) if ok else None for ok in regular]
+
+    @staticmethod
+    def _clean_columns(candidates: List[Dict]) -> List[Dict]:
+        """
+        Vectorized equivalent of the field cleaning in _process_candidate
+
+        Every mapped field must be a string or None, and ASCII in
+        _ASCII_ONLY_FIELDS (see _clean_batch); dates are left to the caller.
+        """
+        col = {
+            field: pa.array([candidate.get(field) for candidate in candidates], type=pa.string())
+            for field in _MAPPED_FIELDS
+        }
+        strip = pc.utf8_trim_whitespace
+        # Empty strings are falsy in _process_candidate, so treat them like null
+        given = {field: pc.not_equal(col[field], "") for field in ("email", "telephone", "country")}
+
+        phone = pc.replace_substring_regex(col["telephone"], r"\D", "")
+        length = pc.utf8_length(phone)
+
+        def format_phone(split: int):
+            return pc.binary_join_element_wise(
+                "(", pc.utf8_slice_codeunits(phone, 0, 2), ") ",
+                pc.utf8_slice_codeunits(phone, 2, split), "-",
+                pc.utf8_slice_codeunits(phone, split), ""
+            )
+
+        country = strip(pc.utf8_lower(col["country"]))
+        state = pc.utf8_slice_codeunits(strip(pc.utf8_upper(col["state"])), 0, 2)
+
+        return pa.table({
+            "id": strip(col["id"]),
+            "cpf": strip(col["cpf"]),
+            "firstName": strip(col["firstName"]),
+            "lastName": strip(col["lastName"]),
+            "fullName": strip(pc.binary_join_element_wise(
+                strip(col["firstName"]), strip(col["lastName"]), " "
+            )),
+            "email": pc.if_else(given["email"], strip(pc.utf8_lower(col["email"])), None),
+            "telephone": pc.if_else(
+                given["telephone"],
+                pc.if_else(  # DDD + 9 digits / DDD + 8 digits
+                    pc.equal(length, 11),
+                    format_phone(7),
+                    pc.if_else(pc.equal(length, 10), format_phone(6), phone)
+                ),
+                None
+            ),
+            "city": strip(col["city"]),
+            # Empty and unknown codes alike become null
+            "state": pc.if_else(pc.is_in(state, value_set=pa.array(sorted(_BRAZIL_UFS))), state, None),
+            "country": pc.if_else(
+                pc.and_not(
+                    pc.fill_null(given["country"], False),
+                    pc.is_in(country, value_set=pa.array(list(_COUNTRY_ALIAS)))
+                ),
+                pc.utf8_title(country),
+                "Brasil"
+            ),
+        }).to_pylist()
+
     @staticmethod
     def _process_candidate(candidate: Dict) -> Dict:
         """Process a single candidate with all fields from Next.js API"""
+        # Campos obrigatórios primeiro: rejeita antes de limpar o resto
+        required = {
+            field: CandidateDataService._get_clean_value(candidate, field)
+            for field in _REQUIRED_FIELDS
+        }
+        for field in _REQUIRED_FIELDS:
+            if not required[field]:
+                raise ValueError(f"Missing required field: {field}")
+
         processed = {
-            "id": CandidateDataService._get_clean_value(candidate, "id"),
-            "cpf": CandidateDataService._get_clean_value(candidate, "cpf"),
-            "firstName": CandidateDataService._get_clean_value(candidate, "firstName"),
-            "lastName": CandidateDataService._get_clean_value(candidate, "lastName"),
+            "id": required["id"],
+            "cpf": required["cpf"],
+            "firstName": required["firstName"],
+            "lastName": required["lastName"],
             "fullName": f"{candidate.get('firstName', '').strip()} {candidate.get('lastName', '').strip()}".strip(),
             "email": CandidateDataService._normalize_email(candidate.get("email")),
             "telephone": CandidateDataService._format_phone(candidate.get("telephone")),
@@ -134,18 +383,10 @@ class CandidateDataService:
             "updatedAt": CandidateDataService._parse_date(candidate.get("updatedAt")),
             "processedAt": datetime.now().isoformat(),
             "_originalData": {
-                k: v for k, v in candidate.items() 
-                if k not in ['id', 'firstName', 'lastName', 'email', 
-                            'telephone', 'city', 'state', 'country', 'cpf',
-                            'createdAt', 'updatedAt']
+                k: v for k, v in candidate.items() if k not in _KNOWN_KEYS
             }
         }
                 
-        required_fields = ['id', 'firstName', 'lastName', 'cpf']
-        for field in required_fields:
-            if not processed.get(field):
-                raise ValueError(f"Missing required field: {field}")
-                
         return processed
 
     @staticmethod
@@ -167,7 +408,12 @@ class CandidateDataService:
         if not phone:
             return None
             
-        digits = ''.join(filter(str.isdigit, str(phone)))
+        phone = str(phone)
+        if phone.isascii():
+            digits = phone.translate(_KEEP_DIGITS)
+        else:
+            # Non-ASCII input may contain other Unicode digits isdigit() accepts
+            digits = ''.join(filter(str.isdigit, phone))
         
         if len(digits) == 11:  # Brazilian format with DDD + 9 digits
             return f"({digits[:2]}) {digits[2:7]}-{digits[7:]}"
@@ -177,10 +423,11 @@ class CandidateDataService:
 
     @staticmethod
     def _normalize_state(state: Optional[str]) -> Optional[str]:
-        """Normalize state to 2-letter uppercase code"""
+        """Normalize state to 2-letter uppercase code; None if it is not a Brazilian UF"""
         if not state:
             return None
-        return str(state).upper().strip()[:2]
+        code = str(state).upper().strip()[:2]
+        return code if code in _BRAZIL_UFS else None
 
     @staticmethod
     def _normalize_country(country: Optional[str]) -> str:
@@ -188,13 +435,15 @@ class CandidateDataService:
         if not country:
             return "Brasil"
         country = str(country).strip().lower()
-        return "Brasil" if country in ("br", "brasil", "brazil") else country.title()
+        return _COUNTRY_ALIAS.get(country) or country.title()
 
     @staticmethod
     def _parse_date(date_str: Optional[str]) -> Optional[str]:
         """Parse and standardize date format"""
         if not date_str:
             return None
+        if isinstance(date_str, str) and _CANONICAL_ISO.fullmatch(date_str):
+            return date_str
             
         try:
             if 'Z' in date_str:
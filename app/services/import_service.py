@@ -1,4 +1,6 @@
-from typing import Optional
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 from uuid import UUID
 from app.models.import_job import ImportJob
@@ -6,6 +8,31 @@ from app.models.organization import Organization
 from app.core.logger import logger
 from app.core.security import verify_api_key
 
+# (api_key, source, destination) -> (granted, expires at); shared by every
+# ImportService in the process, so repeated jobs for a tenant skip the DB
+#
+# Staleness window: a decision can be up to ACCESS_CACHE_TTL seconds old, so an
+# organization deactivated (or activated) in that window keeps its previous
+# answer until the entry expires. The import routes also check the key through
+# Depends(verify_api_key) on every request, ahead of this cache. Nothing in
+# this tree revokes keys or deactivates organizations yet; whatever does must
+# call invalidate_organization_access() to close the window.
+ACCESS_CACHE_TTL = 30
+ACCESS_CACHE_MAXSIZE = 1024
+_access_cache: Dict[Tuple[str, UUID, UUID], Tuple[bool, float]] = {}
+_access_cache_lock = threading.Lock()
+
+
+def invalidate_organization_access(api_key: Optional[str] = None) -> None:
+    """Drop cached access decisions, for one API key or all of them (e.g. on revocation)"""
+    with _access_cache_lock:
+        if api_key is None:
+            _access_cache.clear()
+            return
+        for key in [key for key in _access_cache if key[0] == api_key]:
+            del _access_cache[key]
+
+
 class ImportService:
     def __init__(self, db: Session):
         self.db = db
@@ -13,6 +40,8 @@ class ImportService:
     def verify_organization_access(self, api_key: str, source_org_id: UUID, destination_org_id: UUID) -> bool:
         """
         Verify if the API key has access to both source and destination organizations
+
+        Decisions are cached for ACCESS_CACHE_TTL seconds; errors are never cached.
         
         Args:
             api_key: The API key provided in the request
@@ -22,29 +51,58 @@ class ImportService:
         Returns:
             bool: True if access is granted, False otherwise
         """
+        key = (api_key, source_org_id, destination_org_id)
+        now = time.monotonic()
+        with _access_cache_lock:
+            cached = _access_cache.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        granted = self._check_organization_access(api_key, source_org_id, destination_org_id)
+        if granted is None:
+            return False
+
+        with _access_cache_lock:
+            _access_cache.pop(key, None)
+            if len(_access_cache) >= ACCESS_CACHE_MAXSIZE:
+                # Dicts keep insertion order: the first entry is the oldest
+                del _access_cache[next(iter(_access_cache))]
+            _access_cache[key] = (granted, now + ACCESS_CACHE_TTL)
+        return granted
+
+    def _check_organization_access(
+        self,
+        api_key: str,
+        source_org_id: UUID,
+        destination_org_id: UUID
+    ) -> Optional[bool]:
+        """
+        Uncached access check behind verify_organization_access
+
+        Returns:
+            Optional[bool]: The decision, or None if it could not be made (error)
+        """
         try:
             
             if not verify_api_key(api_key):
                 return False
 
-            # Check if source organization exists and is active
-            source_org = self.db.query(Organization).filter(
-                Organization.id == source_org_id,
-                Organization.is_active == True
-            ).first()
-
-            
-            dest_org = self.db.query(Organization).filter(
-                Organization.id == destination_org_id,
-                Organization.is_active == True
-            ).first()
+            # Check both organizations exist and are active in a single query
+            active_ids = {
+                org_id for (org_id,) in self.db.query(Organization.id).filter(
+                    Organization.id.in_([source_org_id, destination_org_id]),
+                    Organization.is_active == True
+                ).all()
+            }
+            source_org = source_org_id in active_ids
+            dest_org = destination_org_id in active_ids
 
             if not source_org or not dest_org:
                 logger.warning(
                     "Organization verification failed",
                     extra={
-                        "source_org_exists": bool(source_org),
-                        "destination_org_exists": bool(dest_org)
+                        "source_org_exists": source_org,
+                        "destination_org_exists": dest_org
                     }
                 )
                 return False
@@ -64,7 +122,7 @@ class ImportService:
                     "destination_org_id": str(destination_org_id)
                 }
             )
-            return False
+            return None
 
     def get_import_job(self, job_id: UUID) -> Optional[ImportJob]:
         """
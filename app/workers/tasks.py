@@ -0,0 +1,59 @@
+import asyncio
+import uuid
+from functools import lru_cache
+from typing import List
+from celery import Celery
+from app.core.config import settings
+from app.workers.import_worker import process_import_job as run_import_job
+from app.workers.import_worker import process_import_jobs as run_import_jobs
+
+app = Celery("medical_records", broker=settings.CELERY_BROKER_URL)
+app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    # Ack só depois de terminar: se o worker cair no meio, o job volta para a fila
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Imports são longos; não reservar jobs que outro worker poderia pegar
+    worker_prefetch_multiplier=1,
+)
+
+
+@lru_cache(maxsize=None)
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """
+    One event loop per worker process, created lazily after the fork
+
+    asyncio.run() would open and close a loop per task, stranding the pooled
+    asyncpg connections (which belong to the loop that opened them).
+    """
+    return asyncio.new_event_loop()
+
+
+@app.task(name="process_import_job")
+def process_import_job(job_id: str) -> None:
+    """
+    Run an import job on a dedicated worker
+
+    Only the job id goes through the broker; the worker connects with its
+    own DATABASE_URL and never sees the caller's API key.
+
+    Args:
+        job_id: UUID of the import job, as a string
+    """
+    _event_loop().run_until_complete(
+        run_import_job(uuid.UUID(job_id), settings.DATABASE_URL)
+    )
+
+
+@app.task(name="process_import_jobs")
+def process_import_jobs(job_ids: List[str]) -> None:
+    """
+    Run several import jobs concurrently on one worker
+
+    Args:
+        job_ids: UUIDs of the import jobs, as strings
+    """
+    _event_loop().run_until_complete(
+        run_import_jobs([uuid.UUID(job_id) for job_id in job_ids], settings.DATABASE_URL)
+    )
\ No newline at end of file
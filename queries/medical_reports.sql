@@ -15,6 +15,8 @@ CREATE TABLE medical_records (
 -- Índices para melhorar consultas frequentes
 CREATE INDEX idx_medical_records_patient_id ON medical_records (patient_id);
 CREATE INDEX idx_medical_records_organization_id ON medical_records (organization_id);
+-- GIN para consultas de contenção (@>) em record_data
+CREATE INDEX idx_medical_records_record_data ON medical_records USING GIN (record_data jsonb_path_ops);
 
 -- Gatilho para atualizar updated_at automaticamente
 CREATE OR REPLACE FUNCTION update_medical_records_updated_at()
@@ -1,3 +1,5 @@
+import glob
+import json
 import unittest
 import os
 import sys
@@ -6,13 +8,51 @@ import sys
 project_root = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, project_root)
 
+# IDs dos testes descobertos; refeito quando algum tests/test_*.py muda
+DISCOVERY_CACHE = os.path.join(project_root, '.test_discovery_cache.json')
+
+
+def _iter_test_ids(suite):
+    """Flatten a (nested) TestSuite into test ids"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_test_ids(test)
+        else:
+            yield test.id()
+
+
+def _tests_fingerprint():
+    """Test file names plus their newest mtime; any add/remove/edit changes it"""
+    files = sorted(glob.glob(os.path.join(project_root, 'tests', 'test_*.py')))
+    return {
+        'files': files,
+        'mtime': max((os.stat(path).st_mtime for path in files), default=0)
+    }
+
+
 def load_tests():
     test_loader = unittest.TestLoader()
+    fingerprint = _tests_fingerprint()
+
+    try:
+        with open(DISCOVERY_CACHE) as f:
+            cached = json.load(f)
+        if cached['fingerprint'] == fingerprint:
+            return test_loader.loadTestsFromNames(cached['ids'])
+    except (OSError, ValueError, KeyError):
+        pass  # Sem cache (ou inválido): descobre do disco
+
     test_suite = test_loader.discover(
         start_dir=os.path.join(project_root, 'tests'),
         pattern='test_*.py',
         top_level_dir=project_root
     )
+
+    ids = list(_iter_test_ids(test_suite))
+    # Módulos que falharam ao importar viram _FailedTest; não guardar esse resultado
+    if not any(test_id.startswith('unittest.loader.') for test_id in ids):
+        with open(DISCOVERY_CACHE, 'w') as f:
+            json.dump({'fingerprint': fingerprint, 'ids': ids}, f)
     return test_suite
 
 if __name__ == '__main__':
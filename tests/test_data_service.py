@@ -1,8 +1,12 @@
+import asyncio
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock
 import logging
 import os
 import sys
+import time
+
+import httpx
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
@@ -16,10 +20,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 
 class TestCandidateDataService(unittest.TestCase):
-    def setUp(self):
-        self.base_url = "http://api.example.com"
-        self.service = CandidateDataService(base_api_url=self.base_url)
-        self.test_candidate = {
+    @classmethod
+    def setUpClass(cls):
+        # Service and fixture are read-only in the tests, so built once per class
+        cls.base_url = "http://api.example.com"
+        cls.service = CandidateDataService(base_api_url=cls.base_url)
+        cls.test_candidate = {
             "id": "123",
             "firstName": "John",
             "lastName": "Doe",
@@ -34,21 +40,88 @@ class TestCandidateDataService(unittest.TestCase):
         }
         logging.basicConfig(level=logging.CRITICAL)
 
+    @classmethod
+    def tearDownClass(cls):
+        asyncio.run(cls.service.aclose())
+
     def test_example(self):
         """Basic verification test"""
         self.assertTrue(True)
 
-    @patch('requests.Session.get')
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
     def test_fetch_candidates_success(self, mock_get):
         """Candidates search test"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [self.test_candidate]
-        mock_get.return_value = mock_response
+        url = f"{self.base_url}/candidates/Doe"
+        mock_get.return_value = httpx.Response(
+            200, json=[self.test_candidate], request=httpx.Request("GET", url)
+        )
 
-        result = self.service.fetch_candidates_by_lastname("Doe")
+        result = asyncio.run(self.service.fetch_candidates_by_lastname("Doe"))
+        mock_get.assert_awaited_once_with(url)
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["lastName"], "Doe")
 
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    def test_fetch_candidates_cached(self, mock_get):
+        """Fresh cached fetches skip the API; expired ones revalidate with the ETag"""
+        url = f"{self.base_url}/candidates/Doe"
+        store = {}
+        cache = AsyncMock()
+        cache.get.side_effect = lambda key: store.get(key)
+        cache.set.side_effect = lambda key, value, ex: store.__setitem__(key, value)
+        # The shared service stays cache-less for the other tests
+        patcher = patch.object(self.service, "cache", cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_get.return_value = httpx.Response(
+            200, json=[self.test_candidate], headers={"ETag": '"v1"'},
+            request=httpx.Request("GET", url)
+        )
+
+        first = asyncio.run(self.service.fetch_candidates_by_lastname("Doe"))
+        second = asyncio.run(self.service.fetch_candidates_by_lastname("Doe"))
+        self.assertEqual(first, second)
+        mock_get.assert_awaited_once_with(url)
+
+        mock_get.return_value = httpx.Response(304, request=httpx.Request("GET", url))
+        with patch('time.time', return_value=time.time() + self.service.cache_ttl + 1):
+            result = asyncio.run(self.service.fetch_candidates_by_lastname("Doe"))
+        mock_get.assert_awaited_with(url, headers={"If-None-Match": '"v1"'})
+        self.assertEqual(result, first)
+
+    def test_process_candidates(self):
+        """Candidates are cleaned and invalid ones reported in input order"""
+        invalid = {"id": "456", "firstName": "Ana", "lastName": "Silva", "cpf": ""}
+        candidate = dict(self.test_candidate, email=" John@Example.com ", country="brazil", source="web")
+
+        result = self.service.process_candidates([candidate, invalid])
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]["fullName"], "John Doe")
+        self.assertEqual(result[0]["email"], "john@example.com")
+        self.assertEqual(result[0]["telephone"], "(11) 98765-4321")
+        self.assertEqual(result[0]["country"], "Brasil")
+        self.assertEqual(result[0]["createdAt"], "2023-01-01T00:00:00+00:00")
+        self.assertEqual(result[0]["_originalData"], {"source": "web"})
+        self.assertEqual(result[1]["id"], "456")
+        self.assertEqual(result[1]["error"], "Missing required field: cpf")
+
+    def test_process_candidates_matches_single_candidate_path(self):
+        """The column-wise batch path cleans exactly like _process_candidate"""
+        candidates = [
+            dict(self.test_candidate, id="1", telephone="١٢٣٤٥٦٧٨٩٠١", country="ß"),
+            dict(self.test_candidate, id="2", city=" İstanbul ", country="türkiye", state=" sp "),
+            dict(self.test_candidate, id="3", email="ÉLISE@Example.com", firstName=" Zoë "),
+            dict(self.test_candidate, id="4", telephone="+55 (11) 3456-7890", country="o'neil land"),
+        ]
+
+        result = self.service.process_candidates(candidates)
+
+        for candidate, processed in zip(candidates, result):
+            expected = CandidateDataService._process_candidate(candidate)
+            processed.pop("processedAt")
+            expected.pop("processedAt")
+            self.assertEqual(processed, expected)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
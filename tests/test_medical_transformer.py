@@ -0,0 +1,30 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.etl.transformers.medical_transformer import MedicalDataTransformer
+
+
+class TestMedicalDataTransformer(unittest.TestCase):
+    def setUp(self):
+        self.transformer = MedicalDataTransformer(extractor=MagicMock())
+
+    def test_flatten_es_records_keeps_keys_from_every_document(self):
+        """Keys that only appear in later ES documents must not be dropped"""
+        records = [
+            {'a': 1, 'm': {'x': 1}},
+            {'a': 2, 'c': 3, 'm': {'y': 2}}
+        ]
+
+        df = self.transformer._flatten_es_records(records)
+
+        self.assertEqual(sorted(df.columns), ['a', 'c', 'm.x', 'm.y'])
+        self.assertEqual(df['c'].tolist()[1], 3)
+        self.assertEqual(df['m.y'].tolist()[1], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
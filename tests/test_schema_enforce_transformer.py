@@ -0,0 +1,58 @@
+import math
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.schema_enforce_transformer import SchemaEnforcerTransformer
+
+
+class TestSchemaEnforcerTransformer(unittest.TestCase):
+    def setUp(self):
+        self.transformer = SchemaEnforcerTransformer(
+            extractor=MagicMock(),
+            schema={"ok": "bool", "n": "int", "s": "str"}
+        )
+        self.records = [
+            {"ok": "false", "n": 1.7, "s": 1.0},
+            {"ok": "true", "n": None, "s": None}
+        ]
+
+    def _both_paths(self):
+        """Enforce the same records on the Arrow path and on the pandas fallback"""
+        arrow = self.transformer._enforce_schema(self.records)
+        # An unrelated mixed-type column makes Arrow inference fail
+        frame = self.transformer._enforce_schema(
+            [dict(record, mixed=value) for record, value in zip(self.records, [1, "a"])]
+        )
+        self.assertIsInstance(arrow, pa.Table)
+        self.assertIsInstance(frame, pd.DataFrame)
+        return arrow.to_pydict(), frame.to_dict("list")
+
+    def test_bool_strings_parse_the_same_on_both_paths(self):
+        """'false' becomes False whichever path the batch takes"""
+        arrow, frame = self._both_paths()
+        self.assertEqual(arrow["ok"], [False, True])
+        self.assertEqual(frame["ok"], [False, True])
+
+    def test_lossy_int_cast_leaves_column_as_is(self):
+        """Floats with a fraction are not truncated to int on either path"""
+        arrow, frame = self._both_paths()
+        self.assertEqual(arrow["n"], [1.7, None])
+        self.assertEqual(frame["n"][0], 1.7)
+        self.assertTrue(math.isnan(frame["n"][1]))
+
+    def test_str_cast_keeps_nulls_on_both_paths(self):
+        """Nulls stay null instead of becoming the string 'None'"""
+        arrow, frame = self._both_paths()
+        self.assertEqual(arrow["s"], ["1", None])
+        self.assertEqual(frame["s"], ["1", None])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
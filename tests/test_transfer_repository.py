@@ -0,0 +1,81 @@
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.transfer import TransferLog
+from app.repositories.transfer_repository import TransferRepository
+from app.schemas.transfer import TransferStatus
+
+try:
+    import aiosqlite
+except ImportError:
+    aiosqlite = None
+
+
+# SQLite stand-in for transfer_logs; the model's Postgres DDL (gen_random_uuid, ::jsonb) does not run there
+_CREATE_TABLE = """
+CREATE TABLE transfer_logs (
+    id CHAR(32) PRIMARY KEY,
+    record_id CHAR(32) NOT NULL,
+    source_org_id CHAR(32) NOT NULL,
+    destination_org_id CHAR(32) NOT NULL,
+    status VARCHAR NOT NULL,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    completed_at DATETIME,
+    parameters JSON NOT NULL,
+    error_details JSON,
+    audit_log JSON
+)
+"""
+
+
+@unittest.skipIf(aiosqlite is None, "aiosqlite is not installed")
+class TestTransferRepository(unittest.TestCase):
+    def test_get_transfer_after_listing_loads_deferred_columns(self):
+        """A transfer already listed (JSONB deferred) comes back from get_transfer fully loaded"""
+        asyncio.run(self._get_transfer_after_listing())
+
+    async def _get_transfer_after_listing(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(_CREATE_TABLE))
+
+            record_id = uuid.uuid4()
+            transfer_id = uuid.uuid4()
+            async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+                await db.execute(insert(TransferLog).values(
+                    id=transfer_id,
+                    record_id=record_id,
+                    source_org_id=uuid.uuid4(),
+                    destination_org_id=uuid.uuid4(),
+                    status=TransferStatus.PENDING,
+                    created_at=text("CURRENT_TIMESTAMP"),
+                    updated_at=text("CURRENT_TIMESTAMP"),
+                    parameters={"priority": "high"},
+                    audit_log={"actor": "test"}
+                ))
+                await db.commit()
+
+                repository = TransferRepository(db)
+                transfers, _ = await repository.get_transfers_by_record(record_id)
+                transfer = await repository.get_transfer(transfer_id)
+
+                self.assertIs(transfer, transfers[0])
+                self.assertEqual(transfer.parameters, {"priority": "high"})
+                self.assertEqual(transfer.audit_log, {"actor": "test"})
+                self.assertIsNone(transfer.error_details)
+        finally:
+            await engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
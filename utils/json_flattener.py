@@ -1,30 +1,173 @@
 
-from typing import Dict
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 from app.etl.transformers.data_lake_transformer import DataLakeTransformer
 
 
-class JSONFlattenerTransformer(DataLakeTransformer):
-    def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
-        """Recursively flatten nested dictionaries"""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
+def flatten_record(
+    d: Dict,
+    parent_key: str = '',
+    sep: str = '_',
+    keys: Optional[Dict[Tuple[str, Any], str]] = None
+) -> Dict:
+    """
+    Flatten nested dictionaries depth-first with an explicit stack, keeping key order
+
+    Args:
+        d: Record to flatten
+        parent_key: Prefix for every output key
+        sep: Separator between nested keys
+        keys: (prefix, key) -> joined key memo; share one across a batch so
+            records with the same shape reuse the same key strings instead
+            of building them again
+
+    Returns:
+        Flat dict
+    """
+    if keys is None:
+        keys = {}
+    flat = {}
+    # Each frame is (key prefix, iterator over the remaining items of one dict)
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = keys.get((prefix, k))
+            if new_key is None:
+                new_key = keys[prefix, k] = f"{prefix}{sep}{k}" if prefix else k
             if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep).items())
+                stack.append((new_key, iter(v.items())))
+                break
             elif isinstance(v, list):
-                
-                for i, item in enumerate(v):
-                    if isinstance(item, dict):
-                        items.extend(
-                            self._flatten_dict(item, f"{new_key}_{i}", sep).items()
-                        )
+                # Reversed so item 0 is on top; the parent resumes after the last one
+                stack.extend(
+                    (f"{new_key}_{i}", iter(v[i].items()))
+                    for i in reversed(range(len(v)))
+                    if isinstance(v[i], dict)
+                )
+                break
+            else:
+                flat[new_key] = v
+        else:
+            stack.pop()
+    return flat
+
+
+def flatten_records(records: List[Dict], sep: str = '_') -> List[Dict]:
+    """
+    Flatten a whole batch of records
+
+    Plain module-level functions, so the loop pays no attribute or method
+    lookups per record and the work can be shipped to other processes.
+    """
+    keys = {}
+    return [flatten_record(record, '', sep, keys) for record in records]
+
+
+def flatten_records_parallel(records: List[Dict], sep: str = '_', workers: Optional[int] = None) -> List[Dict]:
+    """
+    Flatten a batch across worker processes, one contiguous slice per process
+
+    Records share no state, so each slice is flattened independently and the
+    results are concatenated back in input order.
+
+    Args:
+        records: Records to flatten
+        sep: Separator between nested keys
+        workers: Process count (defaults to the CPU count)
+
+    Returns:
+        Flat dicts, same order as records
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(records) < 2:
+        return flatten_records(records, sep)
+
+    size = -(-len(records) // workers)
+    slices = [records[start:start + size] for start in range(0, len(records), size)]
+    flat = []
+    with ProcessPoolExecutor(max_workers=len(slices)) as executor:
+        for part in executor.map(flatten_records, slices, [sep] * len(slices)):
+            flat.extend(part)
+    return flat
+
+
+@lru_cache(maxsize=32)
+def compile_flattener(paths: Tuple[Tuple[Union[str, int], ...], ...], sep: str = '_') -> Callable[[Dict], Dict]:
+    """
+    Generate a flattener specialized for a known record shape
+
+    Builds and execs a single dict display, e.g. for [('a', 'b'), ('id',)]:
+        def _flat(d): return {'a_b': d['a']['b'], 'id': d['id']}
+    so there is no stack, isinstance check or key joining per record.
+    Records that do not match the shape (missing keys, short lists) go
+    through flatten_record instead; keys outside the paths are dropped.
+
+    Args:
+        paths: Leaf paths; str parts are dict keys, int parts list indexes
+        sep: Separator between nested keys
+
+    Returns:
+        Function flattening one record
+    """
+    items = []
+    for path in paths:
+        key = ''
+        access = 'd'
+        for part in path:
+            if isinstance(part, int):
+                key = f"{key}_{part}"
             else:
-                items.append((new_key, v))
-        return dict(items)
+                key = f"{key}{sep}{part}" if key else part
+            # repr() keeps arbitrary key strings safe inside the generated source
+            access += f"[{part!r}]"
+        items.append(f"{key!r}: {access}")
+
+    source = (
+        "def _flat(d):\n"
+        "    try:\n"
+        f"        return {{{', '.join(items)}}}\n"
+        "    except (KeyError, IndexError, TypeError):\n"
+        "        return _fallback(d, '', sep)\n"
+    )
+    namespace = {'_fallback': flatten_record, 'sep': sep}
+    exec(compile(source, '<json_flattener>', 'exec'), namespace)
+    return namespace['_flat']
+
+
+class JSONFlattenerTransformer(DataLakeTransformer):
+    # Batches at least this large are flattened across processes; below it,
+    # process start-up and pickling the records cost more than they save
+    PARALLEL_THRESHOLD = 100_000
+
+    _compiled: Optional[Callable[[Dict], Dict]] = None
+
+    def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
+        """Flatten nested dictionaries (see flatten_record)"""
+        return flatten_record(d, parent_key, sep)
+
+    def compile(self, schema_paths: Sequence[Sequence[Union[str, int]]]) -> Callable[[Dict], Dict]:
+        """
+        Use a generated flattener for records with a known shape (see compile_flattener)
+
+        Args:
+            schema_paths: Leaf paths of the records, e.g. [('user', 'name'), ('tags', 0, 'k')]
+
+        Returns:
+            The compiled flattener
+        """
+        self._compiled = compile_flattener(tuple(tuple(path) for path in schema_paths))
+        return self._compiled
 
     def transform_api_data(self, *args, **kwargs) -> Dict:
         data = super().transform_api_data(*args, **kwargs)
-        flattened = [self._flatten_dict(record) for record in data["data"]]
-        data["data"] = flattened
-        return data
-
+        records = data["data"]
+        if self._compiled is not None:
+            data["data"] = list(map(self._compiled, records))
+        elif len(records) >= self.PARALLEL_THRESHOLD:
+            data["data"] = flatten_records_parallel(records)
+        else:
+            data["data"] = flatten_records(records)
+        return data
\ No newline at end of file
@@ -0,0 +1,184 @@
+from typing import Any, Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from app.etl.extractors.lucas_technology_service_extractor import UniversalDataExtractor
+from app.etl.transformers.data_lake_transformer import DataLakeTransformer
+
+# Used when a datetime column has no format hint; pandas parses ISO 8601
+# (with or without time / offset) on its C fast path instead of per-row dateutil
+DEFAULT_DATETIME_FORMAT = "ISO8601"
+
+# Schema names with no numpy spelling; anything else goes through np.dtype
+_ARROW_TYPES = {
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "str": pa.string(),
+    "string": pa.string(),
+    "bool": pa.bool_(),
+    "datetime": pa.timestamp("ns", tz="UTC"),
+}
+
+# pandas' astype disagrees with Arrow's cast here ('false' -> True, None ->
+# 'None'), so the pandas fallback casts these columns through Arrow as well
+_ARROW_CAST_DTYPES = frozenset({"bool", "str", "string"})
+
+# Raised by pc.cast for values it cannot convert without loss
+_CAST_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+
+
+def _to_arrow_type(dtype: Any) -> Optional[pa.DataType]:
+    """Arrow type for a schema dtype, or None when it has no direct equivalent"""
+    if dtype in _ARROW_TYPES:
+        return _ARROW_TYPES[dtype]
+    try:
+        return pa.from_numpy_dtype(np.dtype(dtype))
+    except (TypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+class SchemaEnforcerTransformer(DataLakeTransformer):
+    def __init__(self, extractor: UniversalDataExtractor, schema: Dict):
+        super().__init__(extractor)
+        # Example: {"id": "int", "name": "str", "timestamp": "datetime", "day": ("datetime", "%Y-%m-%d")}
+        self.schema = schema
+        # Split once: datetimes are parsed per column (each may have its own
+        # format), everything else is cast with a single DataFrame.astype
+        self._datetime_formats = {}
+        self._dtypes = {}
+        for column, dtype in schema.items():
+            dtype, fmt = dtype if isinstance(dtype, tuple) else (dtype, None)
+            if dtype == "datetime":
+                self._datetime_formats[column] = fmt or DEFAULT_DATETIME_FORMAT
+            else:
+                self._dtypes[column] = dtype
+
+        # Typed Arrow schema for the columnar path; None if some dtype (e.g. a
+        # pandas extension type) has no Arrow equivalent, leaving pandas only
+        types = {
+            column: _to_arrow_type(
+                "datetime" if column in self._datetime_formats else self._dtypes[column]
+            )
+            for column in schema
+        }
+        self.arrow_schema = (
+            pa.schema([pa.field(column, types[column]) for column in schema])
+            if all(t is not None for t in types.values()) else None
+        )
+
+    def _enforce_schema(self, records: List[Dict]) -> Union[pa.Table, pd.DataFrame]:
+        """
+        Apply schema rules to records
+
+        Columns are cast directly in Arrow, narrow numeric types included,
+        without going through Python objects. Records whose columns mix types
+        Arrow cannot infer, or schemas with no Arrow equivalent, fall back to
+        the pandas implementation.
+
+        Returns:
+            Typed pyarrow.Table, or a DataFrame from the fallback
+        """
+        if self.arrow_schema is not None:
+            # Union of keys in first-seen order, as pd.DataFrame(records) does
+            columns = dict.fromkeys(key for record in records for key in record)
+            try:
+                table = pa.table({
+                    column: [record.get(column) for record in records] for column in columns
+                })
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                table = None
+            if table is not None:
+                return self._enforce_schema_arrow(table)
+        return self._enforce_schema_frame(pd.DataFrame(records))
+
+    def _check_columns(self, columns: List[str]) -> None:
+        """Raise for schema columns absent from the data"""
+        missing = self.schema.keys() - set(columns)
+        if missing:
+            raise ValueError(
+                f"Missing required column: {', '.join(str(c) for c in self.schema if c in missing)}"
+            )
+
+    def _enforce_schema_arrow(self, table: pa.Table) -> pa.Table:
+        """Cast each schema column of an Arrow table; uncastable columns are left as-is"""
+        self._check_columns(table.column_names)
+
+        for field in self.arrow_schema:
+            index = table.schema.get_field_index(field.name)
+            column = table.column(index)
+            if field.name in self._datetime_formats:
+                column = self._to_timestamps(column, self._datetime_formats[field.name], field.type)
+            else:
+                try:
+                    # safe=True: lossy casts (1.7 -> int) fail and leave the column as-is
+                    column = pc.cast(column, field.type)
+                except _CAST_ERRORS:
+                    continue  # errors="ignore", as in the pandas path
+            table = table.set_column(index, field.name, column)
+        return table
+
+    @staticmethod
+    def _to_timestamps(column: pa.ChunkedArray, fmt: str, target: pa.DataType) -> pa.ChunkedArray:
+        """Parse a column to UTC timestamps, unparseable values becoming null"""
+        if pa.types.is_string(column.type) and fmt != DEFAULT_DATETIME_FORMAT:
+            # Naive results are taken as UTC, as pd.to_datetime(utc=True) does
+            return pc.strptime(column, format=fmt, unit="ns", error_is_null=True).cast(target)
+        try:
+            return pc.cast(column, target)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # Date-only or invalid values: Arrow's ISO cast is all-or-nothing, pandas coerces
+            return pa.chunked_array([pa.Array.from_pandas(pd.to_datetime(
+                column.to_pandas(),
+                format=DEFAULT_DATETIME_FORMAT,
+                errors="coerce",
+                utc=True,
+                cache=True
+            ))], type=target)
+
+    def _enforce_schema_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply schema rules to DataFrame"""
+        self._check_columns(df.columns)
+
+        for column, fmt in self._datetime_formats.items():
+            df[column] = pd.to_datetime(
+                df[column],
+                format=fmt,
+                errors="coerce",
+                utc=True,
+                cache=True
+            )
+        dtypes = {}
+        for column, dtype in self._dtypes.items():
+            if dtype not in _ARROW_CAST_DTYPES:
+                dtypes[column] = dtype
+                continue
+            # Same cast as the Arrow path; mixed or unparseable columns are left as-is
+            try:
+                array = pc.cast(pa.array(df[column], from_pandas=True), _ARROW_TYPES[dtype])
+            except _CAST_ERRORS:
+                continue
+            df[column] = array.to_numpy(zero_copy_only=False)
+        if dtypes:
+            df = df.astype(dtypes, errors="ignore", copy=False)
+        return df
+
+    def transform_api_data(self, *args, as_records: bool = False, **kwargs) -> Dict:
+        """
+        Extract API data and enforce the schema
+
+        Args:
+            as_records: Return 'data' as a list of dicts instead of the typed
+                table (save_to_raw_zone takes either)
+
+        Returns:
+            Dict with 'data' (Arrow table / DataFrame unless as_records) and 'metadata' keys
+        """
+        data = super().transform_api_data(*args, **kwargs)
+        typed = self._enforce_schema(data["data"])
+        # Only pay the round trip back to dicts when a caller asks for it
+        if as_records:
+            typed = typed.to_pylist() if isinstance(typed, pa.Table) else typed.to_dict("records")
+        data["data"] = typed
+        return data
\ No newline at end of file